@@ -1,33 +1,42 @@
 #!/usr/bin/env python3
 """LinkedIn Job Bot - Main entry point and CLI."""
 import asyncio
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, Group
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.config import get_settings
-from src.database import JobRepository
-from src.linkedin import LinkedInScraper, JobApplier
-from src.ai import CoverLetterGenerator
-from src.scheduler import JobBotScheduler, run_once_if_in_schedule
-from src.resume_selector import get_resume_selector
+
+# Faster event loop where available (not on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
+# Playwright, SQLAlchemy and the AI stack are imported inside the commands
+# that use them, so --help and early exits stay fast
 
 app = typer.Typer(
     name="linkedin-job-bot",
     help="Automated LinkedIn job search and application bot"
 )
-console = Console()
+# CI logs (e.g. GitHub Actions) get plain text
+IS_CI = bool(os.environ.get("CI"))
+console = Console(force_terminal=False, no_color=True) if IS_CI else Console()
 
 
 def print_banner():
-    """Print the application banner."""
+    """Print the application banner (interactive terminals only)."""
+    if IS_CI or not console.is_terminal:
+        return
+    
     banner = """
     ========================================================
           LinkedIn Job Bot v1.0.0
@@ -37,6 +46,22 @@ def print_banner():
     console.print(banner, style="bold cyan")
 
 
+async def queue_cover_letters():
+    """Queue offline (OpenAI Batch API) cover letters for jobs awaiting application."""
+    from src.ai import CoverLetterGenerator
+    from src.database import JobRepository
+    
+    settings = get_settings()
+    repository = JobRepository()
+    cover_letter_gen = CoverLetterGenerator(repository=repository)
+    try:
+        await cover_letter_gen.sync_openai_batches(
+            repository.get_unapplied_easy_apply_jobs(limit=settings.max_applications_per_run)
+        )
+    finally:
+        await cover_letter_gen.aclose()
+
+
 @app.command()
 def search(
     keywords: Optional[str] = typer.Option(
@@ -58,6 +83,16 @@ def search(
         False,
         "--details", "-d",
         help="Fetch detailed job descriptions"
+    ),
+    fast: bool = typer.Option(
+        True,
+        "--fast/--browser",
+        help="Fetch job lists over HTTP (falls back to the browser when blocked)"
+    ),
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency", "-c",
+        help="Number of keywords to search at the same time"
     )
 ):
     """Search for jobs on LinkedIn and save to database."""
@@ -66,11 +101,15 @@ def search(
     
     search_keywords = keywords.split(",") if keywords else settings.keywords_list
     
-    console.print(f"[cyan]Search Keywords:[/cyan] {', '.join(search_keywords)}")
-    console.print(f"[cyan]Experience Levels:[/cyan] {settings.experience_levels}")
-    console.print(f"[cyan]Date Posted:[/cyan] {settings.date_posted}")
-    console.print(f"[cyan]Location:[/cyan] {settings.location}")
-    console.print()
+    console.print(Group(
+        f"[cyan]Search Keywords:[/cyan] {', '.join(search_keywords)}",
+        f"[cyan]Experience Levels:[/cyan] {settings.experience_levels}",
+        f"[cyan]Date Posted:[/cyan] {settings.date_posted}",
+        f"[cyan]Location:[/cyan] {settings.location}",
+        ""
+    ))
+    
+    from src.linkedin import LinkedInScraper
     
     scraper = LinkedInScraper()
     
@@ -79,7 +118,9 @@ def search(
             keywords=search_keywords,
             max_pages_per_keyword=pages,
             get_details=details,
-            easy_apply_only=easy_apply
+            easy_apply_only=easy_apply,
+            fast=fast,
+            concurrency=concurrency
         ))
         console.print(f"\n[bold green]✓ Search complete! Found {len(jobs)} jobs.[/bold green]")
     except KeyboardInterrupt:
@@ -110,13 +151,20 @@ def apply(
         console.print("[yellow]⚠️ Auto-apply is disabled. Enable it in your .env file.[/yellow]")
         raise typer.Exit(0)
     
-    console.print(f"[cyan]Max Applications:[/cyan] {max_apps}")
-    console.print(f"[cyan]Resume:[/cyan] {settings.resume_path}")
-    console.print(f"[cyan]AI Cover Letters:[/cyan] {'Enabled' if use_ai else 'Disabled'}")
-    console.print()
+    console.print(Group(
+        f"[cyan]Max Applications:[/cyan] {max_apps}",
+        f"[cyan]Resume:[/cyan] {settings.resume_path}",
+        f"[cyan]AI Cover Letters:[/cyan] {'Enabled' if use_ai else 'Disabled'}",
+        ""
+    ))
     
-    cover_letter_gen = CoverLetterGenerator() if use_ai else None
-    applier = JobApplier(cover_letter_generator=cover_letter_gen)
+    from src.ai import CoverLetterGenerator
+    from src.database import JobRepository
+    from src.linkedin import JobApplier
+    
+    repository = JobRepository()
+    cover_letter_gen = CoverLetterGenerator(repository=repository) if use_ai else None
+    applier = JobApplier(cover_letter_generator=cover_letter_gen, repository=repository)
     
     try:
         stats = asyncio.run(applier.run(max_applications=max_apps))
@@ -144,6 +192,16 @@ def run(
         True,
         "--easy-apply/--all",
         help="Only search for Easy Apply jobs"
+    ),
+    fast: bool = typer.Option(
+        True,
+        "--fast/--browser",
+        help="Fetch job lists over HTTP (falls back to the browser when blocked)"
+    ),
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency", "-c",
+        help="Number of keywords to search at the same time"
     )
 ):
     """Run full pipeline: search + apply."""
@@ -152,29 +210,54 @@ def run(
     
     search_keywords = keywords.split(",") if keywords else settings.keywords_list
     
-    console.print("[bold cyan]Starting full job search and apply pipeline...[/bold cyan]")
-    console.print(f"[cyan]Keywords:[/cyan] {', '.join(search_keywords)}")
-    console.print(f"[cyan]Max Applications:[/cyan] {max_apps}")
-    console.print()
+    console.print(Group(
+        "[bold cyan]Starting full job search and apply pipeline...[/bold cyan]",
+        f"[cyan]Keywords:[/cyan] {', '.join(search_keywords)}",
+        f"[cyan]Max Applications:[/cyan] {max_apps}",
+        ""
+    ))
+    
+    from src.ai import CoverLetterGenerator
+    from src.database import JobRepository
+    from src.linkedin import LinkedInScraper, JobApplier, BrowserPool
     
     async def full_pipeline():
-        # Step 1: Search
-        console.print("\n[bold]📍 Step 1: Searching for jobs...[/bold]")
-        scraper = LinkedInScraper()
-        await scraper.run(
-            keywords=search_keywords,
-            max_pages_per_keyword=3,
-            easy_apply_only=easy_apply
-        )
+        if not settings.auto_apply_enabled:
+            console.print("\n[bold]📍 Step 1: Searching for jobs...[/bold]")
+            scraper = LinkedInScraper()
+            await scraper.run(
+                keywords=search_keywords,
+                max_pages_per_keyword=3,
+                easy_apply_only=easy_apply,
+                fast=fast,
+                concurrency=concurrency
+            )
+            console.print("\n[yellow]Auto-apply disabled. Skipping applications.[/yellow]")
+            return
         
-        # Step 2: Apply (if enabled)
-        if settings.auto_apply_enabled:
+        # One browser and login serve both steps
+        async with BrowserPool() as pool:
+            # Step 1: Search
+            console.print("\n[bold]📍 Step 1: Searching for jobs...[/bold]")
+            scraper = LinkedInScraper(pool=pool)
+            await scraper.run(
+                keywords=search_keywords,
+                max_pages_per_keyword=3,
+                easy_apply_only=easy_apply,
+                fast=fast,
+                concurrency=concurrency
+            )
+            
+            # Step 2: Apply
             console.print("\n[bold]📍 Step 2: Applying to jobs...[/bold]")
-            cover_letter_gen = CoverLetterGenerator()
-            applier = JobApplier(cover_letter_generator=cover_letter_gen)
+            repository = JobRepository()
+            cover_letter_gen = CoverLetterGenerator(repository=repository)
+            applier = JobApplier(
+                cover_letter_generator=cover_letter_gen,
+                pool=pool,
+                repository=repository
+            )
             await applier.run(max_applications=max_apps)
-        else:
-            console.print("\n[yellow]Auto-apply disabled. Skipping applications.[/yellow]")
     
     try:
         asyncio.run(full_pipeline())
@@ -197,30 +280,55 @@ def schedule(
         18,
         "--end", "-e",
         help="End hour (24h format)"
+    ),
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency", "-c",
+        help="Number of keywords to search at the same time"
     )
 ):
     """Run the bot on a schedule (hourly within specified hours)."""
     print_banner()
     
-    console.print(f"[cyan]Schedule:[/cyan] {start_hour}:00 - {end_hour}:00")
-    console.print("[dim]Bot will run every hour within this window[/dim]")
-    console.print()
+    console.print(Group(
+        f"[cyan]Schedule:[/cyan] {start_hour}:00 - {end_hour}:00",
+        "[dim]Bot will run every hour within this window[/dim]",
+        ""
+    ))
     
     settings = get_settings()
     search_keywords = settings.keywords_list
     
+    from src.ai import CoverLetterGenerator
+    from src.database import JobRepository
+    from src.linkedin import LinkedInScraper, JobApplier, BrowserPool
+    from src.scheduler import JobBotScheduler
+    
+    # One browser for the whole session; it starts on the first run and stays up between runs
+    pool = BrowserPool()
+    
     async def scheduled_job():
-        scraper = LinkedInScraper()
+        scraper = LinkedInScraper(pool=pool)
         await scraper.run(
             keywords=search_keywords,
             max_pages_per_keyword=2,
-            easy_apply_only=True
+            easy_apply_only=True,
+            concurrency=concurrency
         )
         
-        if settings.auto_apply_enabled:
-            cover_letter_gen = CoverLetterGenerator()
-            applier = JobApplier(cover_letter_generator=cover_letter_gen)
-            await applier.run(max_applications=5)
+        if not settings.auto_apply_enabled:
+            if settings.openai_batch_mode:
+                await queue_cover_letters()
+            return
+        
+        repository = JobRepository()
+        cover_letter_gen = CoverLetterGenerator(repository=repository)
+        applier = JobApplier(
+            cover_letter_generator=cover_letter_gen,
+            pool=pool,
+            repository=repository
+        )
+        await applier.run(max_applications=5)
     
     scheduler = JobBotScheduler(
         job_func=scheduled_job,
@@ -228,8 +336,14 @@ def schedule(
         end_hour=end_hour
     )
     
+    async def run_scheduler():
+        try:
+            await scheduler.start_async()
+        finally:
+            await pool.close()
+    
     try:
-        scheduler.start()
+        asyncio.run(run_scheduler())
     except KeyboardInterrupt:
         scheduler.stop()
         console.print("\n[yellow]Scheduler stopped.[/yellow]")
@@ -240,6 +354,9 @@ def stats():
     """Show job search and application statistics."""
     print_banner()
     
+    from rich.table import Table
+    from src.database import JobRepository
+    
     repo = JobRepository()
     stats = repo.get_application_stats()
     
@@ -265,37 +382,41 @@ def jobs(
     """List saved jobs from database."""
     print_banner()
     
+    from rich.table import Table
+    from src.database import JobRepository
+    
     repo = JobRepository()
     
     if keyword:
         job_list = repo.search_jobs(keyword, limit=limit)
         console.print(f"[cyan]Search results for '{keyword}':[/cyan]")
     else:
-        job_list = repo.get_all_jobs(limit=limit)
+        job_list = repo.get_all_jobs(limit=limit)  # Streamed row by row
         console.print("[cyan]Recent jobs:[/cyan]")
     
-    if not job_list:
-        console.print("[yellow]No jobs found.[/yellow]")
-        return
-    
     table = Table()
     table.add_column("ID", style="dim")
-    table.add_column("Title", style="cyan")
-    table.add_column("Company", style="green")
-    table.add_column("Location")
+    # Rich truncates long cells while rendering
+    table.add_column("Title", style="cyan", max_width=43, overflow="ellipsis", no_wrap=True)
+    table.add_column("Company", style="green", max_width=28, overflow="ellipsis", no_wrap=True)
+    table.add_column("Location", max_width=20, overflow="crop", no_wrap=True)
     table.add_column("Easy Apply", style="yellow")
     table.add_column("Posted")
     
     for job in job_list:
         table.add_row(
             str(job.id),
-            job.title[:40] + "..." if len(job.title) > 40 else job.title,
-            job.company[:25] + "..." if len(job.company) > 25 else job.company,
-            job.location[:20] if job.location else "",
+            job.title,
+            job.company,
+            job.location or "",
             "Yes" if job.is_easy_apply else "No",
             job.posted_date or ""
         )
     
+    if not table.row_count:
+        console.print("[yellow]No jobs found.[/yellow]")
+        return
+    
     console.print(table)
 
 
@@ -313,20 +434,27 @@ def resumes(
     settings = get_settings()
     
     if not settings.use_smart_resume_selection:
-        console.print("[yellow]Smart resume selection is disabled.[/yellow]")
-        console.print(f"[cyan]Current resume:[/cyan] {settings.resume_path}")
-        console.print("\n[dim]To enable smart selection, set USE_SMART_RESUME_SELECTION=true in .env[/dim]")
+        console.print(Group(
+            "[yellow]Smart resume selection is disabled.[/yellow]",
+            f"[cyan]Current resume:[/cyan] {settings.resume_path}",
+            "\n[dim]To enable smart selection, set USE_SMART_RESUME_SELECTION=true in .env[/dim]"
+        ))
         return
     
+    from src.resume_selector import get_resume_selector
+    
     selector = get_resume_selector()
     available = selector.list_available_resumes()
     
-    console.print("[bold cyan]Available Resume Profiles:[/bold cyan]")
+    lines = ["[bold cyan]Available Resume Profiles:[/bold cyan]"]
     for profile in available:
         profile_data = selector.resume_profiles[profile]
-        console.print(f"\n[green]• {profile}[/green]")
-        console.print(f"  File: {profile_data['file']}")
-        console.print(f"  Keywords: {', '.join(profile_data['keywords'][:10])}...")
+        lines += [
+            f"\n[green]• {profile}[/green]",
+            f"  File: {profile_data['file']}",
+            f"  Keywords: {', '.join(profile_data['keywords'][:10])}...",
+        ]
+    console.print(Group(*lines))
     
     if test_job:
         console.print(f"\n[bold cyan]Testing job:[/bold cyan] {test_job}")
@@ -340,8 +468,16 @@ def resumes(
 
 
 @app.command()
-def github_action():
+def github_action(
+    concurrency: int = typer.Option(
+        3,
+        "--concurrency", "-c",
+        help="Number of keywords to search at the same time"
+    )
+):
     """Run for GitHub Actions (checks schedule, runs once)."""
+    from src.scheduler import run_once_if_in_schedule
+    
     settings = get_settings()
     
     # Check if within schedule
@@ -349,22 +485,40 @@ def github_action():
         console.print("[dim]Skipping run - outside scheduled hours[/dim]")
         raise typer.Exit(0)
     
+    from src.ai import CoverLetterGenerator
+    from src.database import JobRepository
+    from src.linkedin import LinkedInScraper, JobApplier, BrowserPool
+    
     console.print("[bold cyan]Running GitHub Actions job...[/bold cyan]")
     
-    async def github_action_job():
-        # Search for jobs
-        scraper = LinkedInScraper()
+    async def search_jobs(pool=None):
+        scraper = LinkedInScraper(pool=pool)
         # Search more pages and include non-Easy Apply jobs for better coverage
         await scraper.run(
             keywords=settings.keywords_list,
             max_pages_per_keyword=5,  # Increased from 2 to 5 (125 jobs per keyword)
-            easy_apply_only=False  # Search all jobs, not just Easy Apply
+            easy_apply_only=False,  # Search all jobs, not just Easy Apply
+            concurrency=concurrency
         )
+    
+    async def github_action_job():
+        if not settings.auto_apply_enabled:
+            await search_jobs()
+            if settings.openai_batch_mode:
+                await queue_cover_letters()
+            return
         
-        # Apply if enabled
-        if settings.auto_apply_enabled:
-            cover_letter_gen = CoverLetterGenerator()
-            applier = JobApplier(cover_letter_generator=cover_letter_gen)
+        # Search and apply share one browser and login
+        async with BrowserPool() as pool:
+            await search_jobs(pool)
+            
+            repository = JobRepository()
+            cover_letter_gen = CoverLetterGenerator(repository=repository)
+            applier = JobApplier(
+                cover_letter_generator=cover_letter_gen,
+                pool=pool,
+                repository=repository
+            )
             await applier.run(max_applications=settings.max_applications_per_run)
     
     try:
@@ -372,16 +526,18 @@ def github_action():
         console.print("[bold green]✓ GitHub Action completed successfully![/bold green]")
     except RuntimeError as e:
         if "Failed to log in" in str(e):
-            console.print("[red]" + "="*60 + "[/red]")
-            console.print("[bold red]LOGIN FAILURE DETECTED[/bold red]")
-            console.print("[yellow]This is likely due to LinkedIn security challenges.[/yellow]")
-            console.print("[yellow]The session may have expired or been invalidated.[/yellow]")
-            console.print("\n[cyan]To fix this:[/cyan]")
-            console.print("1. Run the bot locally: [bold]python main.py search --pages 1[/bold]")
-            console.print("2. Complete any security challenges in the browser")
-            console.print("3. Upload the new session: [bold]python scripts/upload_session_to_github.py[/bold]")
-            console.print("4. Update the LINKEDIN_SESSION_JSON secret in GitHub")
-            console.print("[red]" + "="*60 + "[/red]")
+            console.print(Group(
+                "[red]" + "="*60 + "[/red]",
+                "[bold red]LOGIN FAILURE DETECTED[/bold red]",
+                "[yellow]This is likely due to LinkedIn security challenges.[/yellow]",
+                "[yellow]The session may have expired or been invalidated.[/yellow]",
+                "\n[cyan]To fix this:[/cyan]",
+                "1. Run the bot locally: [bold]python main.py search --pages 1[/bold]",
+                "2. Complete any security challenges in the browser",
+                "3. Upload the new session: [bold]python scripts/upload_session_to_github.py[/bold]",
+                "4. Update the LINKEDIN_SESSION_JSON secret in GitHub",
+                "[red]" + "="*60 + "[/red]"
+            ))
             raise typer.Exit(1)
         else:
             console.print(f"[red]Error: {e}[/red]")
@@ -6,13 +6,17 @@ import subprocess
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a shell command."""
+def start_command(args, description):
+    """Start a command (argv list, no shell) without waiting for it."""
     print(f"\n{'='*50}")
     print(f"📦 {description}")
     print(f"{'='*50}")
-    result = subprocess.run(command, shell=True)
-    return result.returncode == 0
+    return subprocess.Popen(args)
+
+
+def run_command(args, description):
+    """Run a command (argv list, no shell) to completion."""
+    return start_command(args, description).wait() == 0
 
 
 def main():
@@ -28,7 +32,7 @@ def main():
     
     # Create virtual environment
     if not Path("venv").exists():
-        run_command("python -m venv venv", "Creating virtual environment...")
+        run_command([sys.executable, "-m", "venv", "venv"], "Creating virtual environment...")
     
     # Determine activate script
     if sys.platform == "win32":
@@ -41,11 +45,14 @@ def main():
         python = "venv/bin/python"
     
     # Install dependencies
-    run_command(f"{pip} install --upgrade pip", "Upgrading pip...")
-    run_command(f"{pip} install -r requirements.txt", "Installing dependencies...")
+    run_command([python, "-m", "pip", "install", "--upgrade", "pip"], "Upgrading pip...")
+    run_command([pip, "install", "-r", "requirements.txt"], "Installing dependencies...")
     
-    # Install Playwright browsers
-    run_command(f"{python} -m playwright install chromium", "Installing Playwright Chromium...")
+    # Download Playwright browsers while the local files are set up
+    playwright_install = start_command(
+        [python, "-m", "playwright", "install", "chromium"],
+        "Installing Playwright Chromium..."
+    )
     
     # Create directories
     for directory in ["data", "browser_data", "resumes", "logs"]:
@@ -58,6 +65,9 @@ def main():
         shutil.copy("config.example.env", ".env")
         print("✓ Created .env from config.example.env")
     
+    if playwright_install.wait() != 0:
+        print("⚠️ Playwright install failed, run: python -m playwright install chromium")
+    
     print("""
     ╔═══════════════════════════════════════════════════════╗
     ║       ✓ Setup Complete!                               ║
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Upload LinkedIn session to GitHub Actions as a secret (one-time setup)."""
-import json
 import base64
 import os
 from pathlib import Path
 
+import orjson
+
 def main():
     """Upload session file content."""
     session_path = Path("browser_data/linkedin_session.json")
@@ -14,20 +15,19 @@ def main():
         print(f"Expected: {session_path.absolute()}")
         return
     
-    # Read session file
-    with open(session_path, 'r', encoding='utf-8') as f:
-        session_content = f.read()
+    # Read session file as raw bytes, no decode/encode round-trip needed
+    session_content = session_path.read_bytes()
     
     # Validate it's valid JSON
     try:
-        json.loads(session_content)
+        orjson.loads(session_content)
         print("[OK] Session file is valid JSON")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"[ERROR] Invalid JSON: {e}")
         return
     
     # Encode to base64 for easier handling
-    encoded = base64.b64encode(session_content.encode('utf-8')).decode('utf-8')
+    encoded = base64.b64encode(session_content).decode('ascii')
     
     print("\n" + "="*60)
     print("INSTRUCTIONS TO UPLOAD SESSION TO GITHUB:")
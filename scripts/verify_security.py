@@ -2,8 +2,9 @@
 """Security verification script - checks for potential credential leaks."""
 import os
 import re
+import mmap
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Simple markers (no special chars for Windows compatibility)
 GREEN = '[OK]'
@@ -12,6 +13,24 @@ YELLOW = '[WARN]'
 RESET = ''
 BOLD = ''
 
+# Patterns that might indicate secrets (bytes, so mapped files need no decoding)
+SECRET_PATTERNS = [
+    (rb'gsk_[a-zA-Z0-9]{32,}', 'Groq API key'),
+    (rb'sk-[a-zA-Z0-9]{32,}', 'OpenAI API key'),
+    (rb'AIza[a-zA-Z0-9_-]{35}', 'Google API key'),
+    (rb'password\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded password'),
+]
+
+# One alternation of all patterns, so each file is scanned in a single pass
+SECRET_SCANNER = re.compile(
+    b"|".join(b"(?P<p%d>%s)" % (i, pattern) for i, (pattern, _) in enumerate(SECRET_PATTERNS)),
+    re.IGNORECASE
+)
+EXAMPLE_MARKERS = re.compile(rb'example|your_', re.IGNORECASE)
+
+# Files above this size are not mapped and scanned
+MAX_SCAN_BYTES = 10 * 1024 * 1024
+
 
 def check_file_exists(filepath: str) -> Tuple[bool, str]:
     """Check if a sensitive file exists."""
@@ -20,20 +39,34 @@ def check_file_exists(filepath: str) -> Tuple[bool, str]:
     return False, f"{GREEN} {filepath} not found (good)"
 
 
-def check_gitignore() -> List[str]:
+def _load_files(paths: List[str]) -> Dict[str, bytes]:
+    """Read every existing file once so all checks share the same bytes."""
+    contents = {}
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                # Oversized files are left to the checks that read them
+                if os.fstat(f.fileno()).st_size <= MAX_SCAN_BYTES:
+                    contents[path] = f.read()
+        except OSError:
+            continue
+    return contents
+
+
+def check_gitignore(content: Optional[bytes] = None) -> List[str]:
     """Check if .gitignore has required entries."""
     issues = []
-    required_entries = ['.env', 'resumes/', '*.pdf', 'data/', 'browser_data/', '*.db']
+    required_entries = [b'.env', b'resumes/', b'*.pdf', b'data/', b'browser_data/', b'*.db']
     
-    gitignore_path = Path('.gitignore')
-    if not gitignore_path.exists():
-        return [f"{RED} .gitignore file not found!"]
-    
-    content = gitignore_path.read_text()
+    if content is None:
+        gitignore_path = Path('.gitignore')
+        if not gitignore_path.exists():
+            return [f"{RED} .gitignore file not found!"]
+        content = gitignore_path.read_bytes()
     
     for entry in required_entries:
         if entry not in content:
-            issues.append(f"{YELLOW} .gitignore missing: {entry}")
+            issues.append(f"{YELLOW} .gitignore missing: {entry.decode()}")
     
     if not issues:
         issues.append(f"{GREEN} .gitignore properly configured")
@@ -41,36 +74,42 @@ def check_gitignore() -> List[str]:
     return issues
 
 
-def check_for_secrets(filepath: str) -> List[str]:
-    """Check a file for potential secrets."""
+def _scan_for_secrets(content, filepath: str) -> List[str]:
+    """Scan a bytes-like buffer for potential secrets."""
     issues = []
+    found = set()
+    for match in SECRET_SCANNER.finditer(content):
+        found.add(match.lastgroup)
+        if len(found) == len(SECRET_PATTERNS):
+            break  # Every kind already seen, the rest of the file can't add issues
+    
+    # Exclude example values
+    if found and not EXAMPLE_MARKERS.search(content):
+        for i, (_, description) in enumerate(SECRET_PATTERNS):
+            if f"p{i}" in found:
+                issues.append(
+                    f"{RED} Potential {description} found in {filepath}"
+                )
     
+    return issues
+
+
+def check_for_secrets(filepath: str) -> List[str]:
+    """Check a file for potential secrets."""
     if not Path(filepath).exists():
         return []
     
-    # Patterns that might indicate secrets
-    secret_patterns = [
-        (r'gsk_[a-zA-Z0-9]{32,}', 'Groq API key'),
-        (r'sk-[a-zA-Z0-9]{32,}', 'OpenAI API key'),
-        (r'AIza[a-zA-Z0-9_-]{35}', 'Google API key'),
-        (r'password\s*=\s*["\'][^"\']{8,}["\']', 'Hardcoded password'),
-    ]
+    size = Path(filepath).stat().st_size
+    if size == 0:
+        return []
+    if size > MAX_SCAN_BYTES:
+        return [f"{YELLOW} {filepath} is too large to scan, review it manually"]
     
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            
-        for pattern, description in secret_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                # Exclude example values
-                if 'example' not in content.lower() and 'your_' not in content.lower():
-                    issues.append(
-                        f"{RED} Potential {description} found in {filepath}"
-                    )
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _scan_for_secrets(mapped, filepath)
     except Exception as e:
-        pass
-    
-    return issues
+        return []
 
 
 def main():
@@ -81,6 +120,16 @@ def main():
     
     all_issues = []
     
+    files_to_check = [
+        'config.example.env',
+        'README.md',
+        '.github/workflows/job-bot.yml',
+        'main.py'
+    ]
+    
+    # Small config files are read up front; scanned files are mapped by check_for_secrets
+    files = _load_files(['.gitignore'])
+    
     # Check 1: .env should exist locally but not be in example files
     print(f"{BOLD}1. Checking sensitive files...{RESET}")
     env_exists = Path('.env').exists()
@@ -91,7 +140,7 @@ def main():
     
     # Check 2: .gitignore configuration
     print(f"\n{BOLD}2. Checking .gitignore...{RESET}")
-    gitignore_issues = check_gitignore()
+    gitignore_issues = check_gitignore(files.get('.gitignore'))
     for issue in gitignore_issues:
         print(f"  {issue}")
         if '[!!' in issue or '[WARN' in issue:
@@ -99,13 +148,6 @@ def main():
     
     # Check 3: Check example files for secrets
     print(f"\n{BOLD}3. Checking for leaked secrets...{RESET}")
-    files_to_check = [
-        'config.example.env',
-        'README.md',
-        '.github/workflows/job-bot.yml',
-        'main.py'
-    ]
-    
     secret_found = False
     for filepath in files_to_check:
         issues = check_for_secrets(filepath)
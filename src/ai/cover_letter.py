@@ -1,15 +1,65 @@
 """AI-powered cover letter generator using various free LLM providers."""
-import json
+import asyncio
+import itertools
+import orjson
+import hashlib
+import random
+import string
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import requests
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import httpx
 from rich.console import Console
 
 from ..config import get_settings, LLMProvider
+from ..database import JobRepository, Job, CoverLetterBatch
+from ..rate_limiter import AsyncTokenBucket
+
+try:
+    import tiktoken
+except ImportError:  # Descriptions are cut by an approximate character count
+    tiktoken = None
 
 console = Console()
 
 
+@lru_cache(maxsize=8)
+def _read_text_cached(path: str, mtime: float) -> str:
+    """Read a text file; the mtime argument invalidates the cache on change."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """Read a text file through the cache, or None if it can't be read."""
+    try:
+        return _read_text_cached(str(path), path.stat().st_mtime)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    """The BPE tokenizer, or None if tiktoken or its vocabulary is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # The vocabulary is downloaded on first use
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (about 4 characters each without tiktoken)."""
+    encoding = _encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
 class CoverLetterGenerator:
     """Generates personalized cover letters using AI."""
     
@@ -34,29 +84,184 @@ Requirements:
 
 Write the cover letter now:"""
     
-    def __init__(self, resume_path: Optional[str] = None):
+    # Literal text and field names of PROMPT_TEMPLATE, parsed once
+    _PROMPT_PARTS = [
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(PROMPT_TEMPLATE)
+    ]
+    
+    # Several jobs in one request; the reply is parsed as a JSON array
+    BATCH_PROMPT_TEMPLATE = """You are a professional cover letter writer. Write a concise, compelling cover letter for each of the {count} job applications below.
+
+Resume Summary:
+{resume_summary}
+
+{jobs}
+
+Requirements:
+1. Keep each letter under 300 words
+2. Be professional but personable
+3. Highlight relevant skills and experience
+4. Show enthusiasm for the role and company
+5. Don't include placeholder text like [Your Name] - write the actual content only
+6. Start directly with the letter content (no "Dear Hiring Manager" unless specifically needed)
+7. Reply with ONLY a JSON array of {count} strings, one cover letter per job, in the order given
+
+JSON array:"""
+    
+    BATCH_JOB_TEMPLATE = """Job {number}:
+Job Title: {job_title}
+Company: {company}
+Job Description:
+{job_description}
+"""
+    
+    # Bump whenever PROMPT_TEMPLATE changes so cached letters are regenerated
+    PROMPT_VERSION = 1
+    
+    # Token budget per letter
+    MAX_TOKENS = 500
+    MAX_DESCRIPTION_TOKENS = 700
+    
+    OPENAI_API_URL = "https://api.openai.com/v1"
+    PROVIDER_ORIGINS = {
+        LLMProvider.GROQ: "https://api.groq.com/",
+        LLMProvider.OPENAI: "https://api.openai.com/",
+        LLMProvider.GOOGLE: "https://generativelanguage.googleapis.com/",
+    }
+    # Batch API states after which a batch will not change any more
+    BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+    
+    # Models of the hosted providers (Ollama's comes from the settings)
+    PROVIDER_MODELS = {
+        LLMProvider.GROQ: "llama2-70b-4096",  # or mixtral-8x7b-32768
+        LLMProvider.OPENAI: "gpt-3.5-turbo",
+        LLMProvider.GOOGLE: "gemini-pro",
+    }
+    
+    # Connection pool shared by all provider calls. Letters are requested
+    # minutes apart while forms are filled, so idle connections are kept well
+    # past httpx's 5 s default instead of paying a new TLS handshake each time.
+    HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+    HTTP_LIMITS = httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=300.0
+    )
+    
+    # Transient failures (timeouts, 429, 5xx) are retried with jittered backoff
+    MAX_ATTEMPTS = 5
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    BACKOFF_INITIAL = 1.0
+    BACKOFF_MAX = 20.0
+    
+    def __init__(
+        self,
+        resume_path: Optional[str] = None,
+        repository: Optional[JobRepository] = None
+    ):
         """Initialize the cover letter generator."""
         self.settings = get_settings()
+        self.repository = repository or JobRepository()
         self.resume_path = resume_path or self.settings.resume_path
-        self.resume_summary = self._load_resume_summary()
+        self.set_resume_summary(self._load_resume_summary())
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limits: Dict[LLMProvider, Tuple[asyncio.Semaphore, Optional[AsyncTokenBucket]]] = {}
+        
+        # Requests rotate over every provider that has credentials
+        self.providers = [
+            provider for provider in self.settings.llm_providers_list
+            if self._has_credentials(provider)
+        ] or list(self.settings.llm_providers_list)
+        self._rotation = itertools.cycle(range(len(self.providers)))
+        
+        # Optional second cache tier for near-duplicate postings
+        self.semantic_cache = None
+        if self.settings.cover_letter_semantic_cache:
+            from .semantic_cache import SemanticCoverLetterCache
+            self.semantic_cache = SemanticCoverLetterCache(
+                self.repository,
+                threshold=self.settings.cover_letter_similarity_threshold
+            )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for LLM calls, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.HTTP_TIMEOUT, limits=self.HTTP_LIMITS)
+        return self._client
+    
+    def _provider_limits(
+        self,
+        provider: LLMProvider
+    ) -> Tuple[asyncio.Semaphore, Optional[AsyncTokenBucket]]:
+        """Concurrency semaphore and requests-per-minute bucket for a provider."""
+        if provider not in self._limits:
+            concurrency = max(1, self.settings.llm_max_concurrency)
+            rpm = self.settings.llm_rpm(provider)
+            self._limits[provider] = (
+                asyncio.Semaphore(concurrency),
+                AsyncTokenBucket.per_minute(rpm, capacity=concurrency) if rpm > 0 else None
+            )
+        return self._limits[provider]
+    
+    async def prewarm(self):
+        """Open pooled connections to the providers so the first letter skips the TLS handshake."""
+        origins = [
+            self.PROVIDER_ORIGINS.get(provider, f"{self.settings.ollama_base_url}/")
+            for provider in self.providers if self._has_credentials(provider)
+        ]
+        # Any response, even an error status, leaves a connection in the pool
+        await asyncio.gather(
+            *(self.client.head(origin, timeout=5) for origin in origins),
+            return_exceptions=True
+        )
+    
+    async def aclose(self):
+        """Close the HTTP client; a new one is created if used again."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _timeout(self, provider: LLMProvider) -> httpx.Timeout:
+        """Connect and read timeouts for a provider's requests."""
+        return httpx.Timeout(
+            connect=self.settings.llm_connect_timeout_s,
+            read=self.settings.llm_read_timeout(provider),
+            write=10.0,
+            pool=5.0
+        )
+    
+    def _has_credentials(self, provider: LLMProvider) -> bool:
+        """Whether a provider can be called (Ollama needs no key)."""
+        return {
+            LLMProvider.OLLAMA: True,
+            LLMProvider.GROQ: bool(self.settings.groq_api_key),
+            LLMProvider.OPENAI: bool(self.settings.openai_api_key),
+            LLMProvider.GOOGLE: bool(self.settings.google_ai_api_key),
+        }.get(provider, False)
+    
+    def _model_name(self, provider: LLMProvider) -> str:
+        """Name of the model a provider generates with."""
+        if provider == LLMProvider.OLLAMA:
+            return self.settings.ollama_model
+        return self.PROVIDER_MODELS.get(provider, "")
+    
+    @staticmethod
+    def _hash(text: str) -> str:
+        """Stable content hash used for cache keys."""
+        return hashlib.blake2b(text.encode("utf-8")).hexdigest()
     
     def _load_resume_summary(self) -> str:
         """Load resume summary from file or return default."""
         # Try to load from a text version of resume
-        txt_path = Path(self.resume_path).with_suffix(".txt")
-        if txt_path.exists():
-            try:
-                return txt_path.read_text(encoding="utf-8")[:2000]  # Limit length
-            except:
-                pass
+        text = _read_text(Path(self.resume_path).with_suffix(".txt"))
+        if text is not None:
+            return text[:2000]  # Limit length
         
         # Try to load from a summary file
-        summary_path = Path(self.resume_path).parent / "resume_summary.txt"
-        if summary_path.exists():
-            try:
-                return summary_path.read_text(encoding="utf-8")
-            except:
-                pass
+        text = _read_text(Path(self.resume_path).parent / "resume_summary.txt")
+        if text is not None:
+            return text
         
         # Return placeholder
         return """
@@ -69,45 +274,312 @@ Passionate about learning new technologies and solving complex problems.
         self,
         job_title: str,
         company: str,
-        job_description: str
+        job_description: str,
+        on_token: Optional[Callable[[str], None]] = None
     ) -> Optional[str]:
-        """Generate a cover letter for a job."""
-        prompt = self.PROMPT_TEMPLATE.format(
-            job_title=job_title,
-            company=company,
-            job_description=job_description[:3000],  # Limit description length
-            resume_summary=self.resume_summary
+        """Generate a cover letter for a job, reusing a cached one if possible.
+        
+        on_token, if given, receives the text as it arrives (streamed from
+        Ollama, in one piece from the other providers).
+        """
+        job_description = _truncate_tokens(job_description, self.MAX_DESCRIPTION_TOKENS)
+        # Cache lookups hit SQLite and may embed the job; keep them off the event loop
+        job_hash, embedding, cached = await asyncio.to_thread(
+            self._lookup, job_title, company, job_description
         )
+        if cached:
+            if on_token:
+                on_token(cached)
+            return cached
         
-        provider = self.settings.llm_provider
+        cover_letter = await self._generate(
+            self._prompt(job_title, company, job_description), on_token=on_token
+        )
+        if cover_letter:
+            await asyncio.to_thread(self._store, job_hash, company, cover_letter, embedding)
+        return cover_letter
+    
+    async def generate_batch(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        batch_size: int = 5
+    ) -> List[Optional[str]]:
+        """Generate cover letters for (title, company, description) jobs, several per request."""
+        jobs = [
+            (title, company, _truncate_tokens(description, self.MAX_DESCRIPTION_TOKENS))
+            for title, company, description in jobs
+        ]
+        letters: List[Optional[str]] = [None] * len(jobs)
         
-        try:
-            if provider == LLMProvider.OLLAMA:
-                return await self._generate_with_ollama(prompt)
-            elif provider == LLMProvider.GROQ:
-                return await self._generate_with_groq(prompt)
-            elif provider == LLMProvider.OPENAI:
-                return await self._generate_with_openai(prompt)
-            elif provider == LLMProvider.GOOGLE:
-                return await self._generate_with_google(prompt)
+        # Only cache misses go to the LLM
+        pending = []
+        lookups = await asyncio.to_thread(lambda: [self._lookup(*job) for job in jobs])
+        for i, (job_hash, embedding, cached) in enumerate(lookups):
+            if cached:
+                letters[i] = cached
             else:
-                console.print(f"[yellow]Unknown LLM provider: {provider}[/yellow]")
-                return None
-        except Exception as e:
-            console.print(f"[red]Error generating cover letter: {e}[/red]")
+                pending.append((i, job_hash, embedding))
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            chunk_jobs = [jobs[i] for i, _, _ in chunk]
+            
+            generated = None
+            if len(chunk) > 1:
+                generated = self._parse_batch(
+                    await self._generate(
+                        self._batch_prompt(chunk_jobs),
+                        max_tokens=self.MAX_TOKENS * len(chunk)
+                    ),
+                    len(chunk)
+                )
+                if generated is None:
+                    console.print("[yellow]Could not parse batched cover letters, generating one by one[/yellow]")
+            
+            if generated is None:
+                generated = await asyncio.gather(*(
+                    self._generate(self._prompt(title, company, description))
+                    for title, company, description in chunk_jobs
+                ))
+            
+            for (i, _, _), cover_letter in zip(chunk, generated):
+                letters[i] = cover_letter
+            await asyncio.to_thread(lambda: [
+                self._store(job_hash, jobs[i][1], cover_letter, embedding)
+                for (i, job_hash, embedding), cover_letter in zip(chunk, generated)
+                if cover_letter
+            ])
+        
+        return letters
+    
+    def _prompt(self, job_title: str, company: str, job_description: str) -> str:
+        """Fill PROMPT_TEMPLATE from its pre-parsed parts."""
+        values = {
+            "job_title": job_title,
+            "company": company,
+            "job_description": job_description,
+            "resume_summary": self.resume_summary
+        }
+        return "".join(
+            literal + (values[field] if field is not None else "")
+            for literal, field in self._PROMPT_PARTS
+        )
+    
+    def _batch_prompt(self, jobs: List[Tuple[str, str, str]]) -> str:
+        """Build one prompt asking for a letter per job."""
+        return self.BATCH_PROMPT_TEMPLATE.format(
+            count=len(jobs),
+            resume_summary=self.resume_summary,
+            jobs="\n".join(
+                self.BATCH_JOB_TEMPLATE.format(
+                    number=number,
+                    job_title=title,
+                    company=company,
+                    job_description=description
+                )
+                for number, (title, company, description) in enumerate(jobs, 1)
+            )
+        )
+    
+    @staticmethod
+    def _parse_batch(text: Optional[str], count: int) -> Optional[List[str]]:
+        """Parse a JSON array of `count` letters out of a reply, or None."""
+        if not text:
+            return None
+        
+        # Models like to wrap JSON in prose or code fences
+        start, end = text.find("["), text.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            letters = orjson.loads(text[start:end + 1])
+        except orjson.JSONDecodeError:
+            return None
+        
+        if (
+            not isinstance(letters, list)
+            or len(letters) != count
+            or not all(isinstance(letter, str) and letter.strip() for letter in letters)
+        ):
+            return None
+        return [letter.strip() for letter in letters]
+    
+    def _job_key(self, job_title: str, company: str, job_description: str) -> str:
+        """Cache key of a job's letter for the current provider and model."""
+        # Switching providers or models must not serve the old models' letters
+        models = ",".join(f"{provider.value}:{self._model_name(provider)}" for provider in self.providers)
+        return self._hash(f"{models}|{job_title}|{company}|{job_description}")
+    
+    def _lookup(
+        self,
+        job_title: str,
+        company: str,
+        job_description: str
+    ) -> Tuple[str, Optional[Any], Optional[str]]:
+        """Return (cache key, embedding, cached letter or None) for a job."""
+        job_hash = self._job_key(job_title, company, job_description)
+        
+        cached = self.repository.get_cached_cover_letter(
+            job_hash, self.resume_hash, self.PROMPT_VERSION
+        )
+        if cached:
+            console.print("[dim]Using cached cover letter[/dim]")
+            return job_hash, None, cached
+        
+        embedding = self._embed_job(job_title, company, job_description)
+        if embedding is not None:
+            cover_letter = self.semantic_cache.lookup(
+                embedding, company, self.resume_hash, self.PROMPT_VERSION
+            )
+            if cover_letter:
+                # Store under the exact key too so the next run is a plain hit
+                self.repository.save_cover_letter(
+                    job_hash, self.resume_hash, self.PROMPT_VERSION, cover_letter,
+                    company=company
+                )
+                return job_hash, embedding, cover_letter
+        
+        return job_hash, embedding, None
+    
+    def _store(self, job_hash: str, company: str, cover_letter: str, embedding):
+        """Cache a freshly generated letter in the database and the semantic index."""
+        self.repository.save_cover_letter(
+            job_hash, self.resume_hash, self.PROMPT_VERSION, cover_letter,
+            company=company,
+            embedding=embedding.tobytes() if embedding is not None else None
+        )
+        if embedding is not None:
+            self.semantic_cache.add(
+                embedding, company, cover_letter, self.resume_hash, self.PROMPT_VERSION
+            )
+    
+    def _embed_job(self, job_title: str, company: str, job_description: str):
+        """Embed the job for the semantic cache, or None when it is unavailable."""
+        if not self.semantic_cache:
             return None
+        
+        try:
+            return self.semantic_cache.embed(f"{job_title}\n{company}\n{job_description}")
+        except ImportError:
+            console.print("[yellow]fastembed not installed, semantic cover letter cache disabled[/yellow]")
+            self.semantic_cache = None
+        except Exception as e:
+            console.print(f"[yellow]Could not embed job for the semantic cache: {e}[/yellow]")
+        return None
+    
+    async def _generate(
+        self,
+        prompt: str,
+        max_tokens: int = MAX_TOKENS,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """Send a prompt to the next provider in the rotation, failing over to the others."""
+        generators = {
+            LLMProvider.OLLAMA: self._generate_with_ollama,
+            LLMProvider.GROQ: self._generate_with_groq,
+            LLMProvider.OPENAI: self._generate_with_openai,
+            LLMProvider.GOOGLE: self._generate_with_google,
+        }
+        
+        start = next(self._rotation)
+        providers = self.providers[start:] + self.providers[:start]
+        for i, provider in enumerate(providers):
+            # Stay under the provider's concurrency limit instead of collecting 429s
+            semaphore, _ = self._provider_limits(provider)
+            try:
+                async with semaphore:
+                    if provider == LLMProvider.OLLAMA:
+                        cover_letter = await self._generate_with_ollama(prompt, max_tokens, on_token)
+                    else:
+                        cover_letter = await generators[provider](prompt, max_tokens)
+                        if cover_letter and on_token:
+                            on_token(cover_letter)
+            except Exception as e:
+                console.print(f"[red]Error generating cover letter: {e}[/red]")
+                cover_letter = None
+            
+            if cover_letter:
+                return cover_letter
+            if i + 1 < len(providers):
+                console.print(f"[yellow]{provider.value} failed, trying {providers[i + 1].value}[/yellow]")
+        
+        return None
+    
+    async def _post(self, provider: LLMProvider, url: str, **kwargs) -> httpx.Response:
+        """POST to a provider, retrying transient failures. Raises on the final failure."""
+        return await self._request(provider, "POST", url, **kwargs)
+    
+    async def _request(
+        self,
+        provider: LLMProvider,
+        method: str,
+        url: str,
+        stream: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a request to a provider, retrying transient failures.
+        
+        With stream=True the body is left unread; the caller must close the response.
+        """
+        _, bucket = self._provider_limits(provider)
+        kwargs.setdefault("timeout", self._timeout(provider))
+        if "json" in kwargs:
+            # Encode once with orjson rather than stdlib json on every attempt
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+        
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            if bucket:
+                await bucket.acquire()
+            
+            retry_after = None
+            try:
+                request = self.client.build_request(method, url, **kwargs)
+                response = await self.client.send(request, stream=stream)
+                if response.is_success:
+                    return response
+                if stream:
+                    await response.aclose()
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_ATTEMPTS:
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After")
+                reason = f"HTTP {response.status_code}"
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # An unreachable host is better handled by failing over to another provider
+                if attempt == self.MAX_ATTEMPTS or len(self.providers) > 1:
+                    raise
+                reason = "connection failed"
+            except httpx.TransportError as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                reason = type(e).__name__
+            
+            delay = min(self.BACKOFF_MAX, self.BACKOFF_INITIAL * 2 ** (attempt - 1))
+            delay += random.uniform(0, delay)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            console.print(
+                f"[dim]{provider.value} request failed ({reason}), "
+                f"retrying in {delay:.1f}s ({attempt}/{self.MAX_ATTEMPTS})[/dim]"
+            )
+            await asyncio.sleep(delay)
     
-    async def _generate_with_ollama(self, prompt: str) -> Optional[str]:
-        """Generate using Ollama (free, local or remote)."""
+    async def _generate_with_ollama(
+        self,
+        prompt: str,
+        max_tokens: int = MAX_TOKENS,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """Generate using Ollama (free, local or remote), streaming the response."""
         url = f"{self.settings.ollama_base_url}/api/generate"
         
         payload = {
             "model": self.settings.ollama_model,
             "prompt": prompt,
-            "stream": False,
+            "stream": True,
             "options": {
                 "temperature": 0.7,
-                "num_predict": 500
+                "num_predict": max_tokens
             }
         }
         
@@ -117,11 +589,29 @@ Passionate about learning new technologies and solving complex problems.
             headers["Authorization"] = f"Bearer {self.settings.ollama_api_key}"
         
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=60)
-            response.raise_for_status()
-            result = response.json()
-            return result.get("response", "").strip()
-        except requests.exceptions.ConnectionError:
+            response = await self._request(
+                LLMProvider.OLLAMA, "POST", url, stream=True, json=payload, headers=headers
+            )
+            # One JSON object per line, each carrying the next piece of text
+            pieces = []
+            try:
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if chunk.get("error"):
+                        raise RuntimeError(chunk["error"])
+                    piece = chunk.get("response", "")
+                    if piece:
+                        pieces.append(piece)
+                        if on_token:
+                            on_token(piece)
+                    if chunk.get("done"):
+                        break
+            finally:
+                await response.aclose()
+            return "".join(pieces).strip()
+        except httpx.ConnectError:
             console.print("[red]Could not connect to Ollama.[/red]")
             console.print(f"[dim]URL: {self.settings.ollama_base_url}[/dim]")
             if "localhost" in self.settings.ollama_base_url:
@@ -133,7 +623,7 @@ Passionate about learning new technologies and solving complex problems.
             console.print(f"[red]Ollama error: {e}[/red]")
             return None
     
-    async def _generate_with_groq(self, prompt: str) -> Optional[str]:
+    async def _generate_with_groq(self, prompt: str, max_tokens: int = MAX_TOKENS) -> Optional[str]:
         """Generate using Groq API (free tier available)."""
         if not self.settings.groq_api_key:
             console.print("[red]GROQ_API_KEY not set[/red]")
@@ -147,61 +637,208 @@ Passionate about learning new technologies and solving complex problems.
         }
         
         payload = {
-            "model": "llama2-70b-4096",  # or mixtral-8x7b-32768
+            "model": self.PROVIDER_MODELS[LLMProvider.GROQ],
             "messages": [
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.7,
-            "max_tokens": 500
+            "max_tokens": max_tokens
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            result = response.json()
+            response = await self._post(LLMProvider.GROQ, url, headers=headers, json=payload)
+            result = orjson.loads(response.content)
             return result["choices"][0]["message"]["content"].strip()
         except Exception as e:
             console.print(f"[red]Groq API error: {e}[/red]")
             return None
     
-    async def _generate_with_openai(self, prompt: str) -> Optional[str]:
+    async def _generate_with_openai(self, prompt: str, max_tokens: int = MAX_TOKENS) -> Optional[str]:
         """Generate using OpenAI API."""
         if not self.settings.openai_api_key:
             console.print("[red]OPENAI_API_KEY not set[/red]")
             return None
         
-        url = "https://api.openai.com/v1/chat/completions"
+        url = f"{self.OPENAI_API_URL}/chat/completions"
         
         headers = {
             "Authorization": f"Bearer {self.settings.openai_api_key}",
             "Content-Type": "application/json"
         }
         
-        payload = {
-            "model": "gpt-3.5-turbo",
+        try:
+            response = await self._post(
+                LLMProvider.OPENAI, url, headers=headers,
+                json=self._openai_payload(prompt, max_tokens)
+            )
+            result = orjson.loads(response.content)
+            return result["choices"][0]["message"]["content"].strip()
+        except Exception as e:
+            console.print(f"[red]OpenAI API error: {e}[/red]")
+            return None
+    
+    def _openai_payload(self, prompt: str, max_tokens: int = MAX_TOKENS) -> dict:
+        """Chat completion request body, shared by realtime and batch calls."""
+        return {
+            "model": self.PROVIDER_MODELS[LLMProvider.OPENAI],
             "messages": [
                 {"role": "user", "content": prompt}
             ],
             "temperature": 0.7,
-            "max_tokens": 500
+            "max_tokens": max_tokens
         }
+    
+    # ==================== OpenAI Batch API ====================
+    
+    def _batch_mode(self) -> bool:
+        """Whether letters may be generated offline through OpenAI's Batch API."""
+        return (
+            self.settings.openai_batch_mode
+            and self.providers == [LLMProvider.OPENAI]
+            and bool(self.settings.openai_api_key)
+        )
+    
+    async def sync_openai_batches(self, jobs: List[Job]) -> int:
+        """Collect finished batches, then queue letters for jobs without one."""
+        if not self._batch_mode():
+            return 0
+        
+        collected = await self.collect_openai_batches()
+        await self.submit_openai_batch(jobs)
+        return collected
+    
+    async def submit_openai_batch(self, jobs: List[Job]) -> Optional[str]:
+        """Submit one batch with a letter request per uncached job. Returns the batch ID."""
+        queued = {
+            job_id
+            for batch in self.repository.get_open_cover_letter_batches()
+            for job_id in batch.job_id_list
+        }
+        
+        candidates = [
+            (job, _truncate_tokens(job.description or "", self.MAX_DESCRIPTION_TOKENS))
+            for job in jobs if job.id not in queued
+        ]
+        # Cache lookups hit the database and the embedding model; keep them off the loop
+        lookups = await asyncio.to_thread(lambda: [
+            self._lookup(job.title, job.company, description) for job, description in candidates
+        ])
         
+        lines = []
+        job_ids = []
+        for (job, description), (_, _, cached) in zip(candidates, lookups):
+            if cached:
+                continue
+            
+            prompt = self._prompt(job.title, job.company, description)
+            lines.append(orjson.dumps({
+                "custom_id": str(job.id),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_payload(prompt)
+            }))
+            job_ids.append(job.id)
+        
+        if not lines:
+            return None
+        
+        headers = {"Authorization": f"Bearer {self.settings.openai_api_key}"}
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            result = response.json()
-            return result["choices"][0]["message"]["content"].strip()
+            upload = await self._post(
+                LLMProvider.OPENAI, f"{self.OPENAI_API_URL}/files",
+                headers=headers,
+                data={"purpose": "batch"},
+                files={"file": ("cover_letters.jsonl", b"\n".join(lines), "application/jsonl")}
+            )
+            response = await self._post(
+                LLMProvider.OPENAI, f"{self.OPENAI_API_URL}/batches",
+                headers=headers,
+                json={
+                    "input_file_id": orjson.loads(upload.content)["id"],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h"
+                }
+            )
         except Exception as e:
-            console.print(f"[red]OpenAI API error: {e}[/red]")
+            console.print(f"[red]Could not submit OpenAI batch: {e}[/red]")
             return None
+        
+        batch_id = orjson.loads(response.content)["id"]
+        self.repository.add_cover_letter_batch(
+            batch_id, self.resume_hash, self.PROMPT_VERSION, job_ids
+        )
+        console.print(f"[cyan]Queued {len(job_ids)} cover letters in OpenAI batch {batch_id}[/cyan]")
+        return batch_id
     
-    async def _generate_with_google(self, prompt: str) -> Optional[str]:
+    async def collect_openai_batches(self) -> int:
+        """Cache the letters of finished batches. Returns how many were stored."""
+        if not self._batch_mode():
+            return 0
+        
+        headers = {"Authorization": f"Bearer {self.settings.openai_api_key}"}
+        stored = 0
+        
+        for batch in self.repository.get_open_cover_letter_batches():
+            try:
+                response = await self._request(
+                    LLMProvider.OPENAI, "GET",
+                    f"{self.OPENAI_API_URL}/batches/{batch.batch_id}",
+                    headers=headers
+                )
+                info = orjson.loads(response.content)
+                if info["status"] not in self.BATCH_FINAL_STATUSES:
+                    continue
+                
+                if info.get("output_file_id"):
+                    output = await self._request(
+                        LLMProvider.OPENAI, "GET",
+                        f"{self.OPENAI_API_URL}/files/{info['output_file_id']}/content",
+                        headers=headers
+                    )
+                    stored += self._store_batch_output(batch, output.content)
+                
+                self.repository.finish_cover_letter_batch(batch.batch_id, info["status"])
+            except Exception as e:
+                console.print(f"[yellow]Could not check OpenAI batch {batch.batch_id}: {e}[/yellow]")
+        
+        if stored:
+            console.print(f"[green]Cached {stored} cover letters from OpenAI batches[/green]")
+        return stored
+    
+    def _store_batch_output(self, batch: CoverLetterBatch, content: bytes) -> int:
+        """Cache the successful letters of a batch output file."""
+        letters = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            letters[int(record["custom_id"])] = (
+                response["body"]["choices"][0]["message"]["content"].strip()
+            )
+        
+        for job in self.repository.get_jobs_by_ids(list(letters)):
+            description = _truncate_tokens(job.description or "", self.MAX_DESCRIPTION_TOKENS)
+            job_hash = self._job_key(job.title, job.company, description)
+            self.repository.save_cover_letter(
+                job_hash, batch.resume_hash, batch.prompt_version, letters[job.id],
+                company=job.company
+            )
+        return len(letters)
+    
+    async def _generate_with_google(self, prompt: str, max_tokens: int = MAX_TOKENS) -> Optional[str]:
         """Generate using Google AI (Gemini) API."""
         if not self.settings.google_ai_api_key:
             console.print("[red]GOOGLE_AI_API_KEY not set[/red]")
             return None
         
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-pro:generateContent?key={self.settings.google_ai_api_key}"
+        url = (
+            "https://generativelanguage.googleapis.com/v1beta/models/"
+            f"{self.PROVIDER_MODELS[LLMProvider.GOOGLE]}:generateContent"
+            f"?key={self.settings.google_ai_api_key}"
+        )
         
         payload = {
             "contents": [
@@ -213,14 +850,13 @@ Passionate about learning new technologies and solving complex problems.
             ],
             "generationConfig": {
                 "temperature": 0.7,
-                "maxOutputTokens": 500
+                "maxOutputTokens": max_tokens
             }
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=30)
-            response.raise_for_status()
-            result = response.json()
+            response = await self._post(LLMProvider.GOOGLE, url, json=payload)
+            result = orjson.loads(response.content)
             return result["candidates"][0]["content"]["parts"][0]["text"].strip()
         except Exception as e:
             console.print(f"[red]Google AI error: {e}[/red]")
@@ -228,7 +864,9 @@ Passionate about learning new technologies and solving complex problems.
     
     def set_resume_summary(self, summary: str):
         """Update the resume summary used for generation."""
-        self.resume_summary = summary
+        # Blank lines and indentation only cost prompt tokens
+        self.resume_summary = "\n".join(line.strip() for line in summary.splitlines() if line.strip())
+        self.resume_hash = self._hash(summary)
 
 
 class SimpleCoverLetterGenerator:
@@ -265,6 +903,9 @@ organization. Thank you for your time and consideration."""
         """Initialize simple generator."""
         self.template_index = 0
     
+    async def aclose(self):
+        """Nothing to release; matches CoverLetterGenerator."""
+    
     async def generate(
         self,
         job_title: str,
@@ -0,0 +1,97 @@
+"""Embedding-similarity cache for cover letters of near-duplicate jobs."""
+import threading
+from typing import List, Optional
+import numpy as np
+from rich.console import Console
+
+from ..database import JobRepository
+
+console = Console()
+
+
+class SemanticCoverLetterCache:
+    """Finds cached cover letters written for near-identical job postings.
+
+    Methods are called from worker threads of concurrent generations, so the
+    model and the index are only touched under one lock.
+    """
+
+    MODEL_NAME = "BAAI/bge-small-en-v1.5"
+
+    def __init__(self, repository: JobRepository, threshold: float = 0.93):
+        """Initialize the cache; the model and index load on first use."""
+        self.repository = repository
+        self.threshold = threshold
+        self._model = None
+        self._index_key = None
+        self._matrix: Optional[np.ndarray] = None  # One L2-normalized row per letter
+        self._companies: List[Optional[str]] = []
+        self._letters: List[str] = []
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed job text as a normalized float32 vector."""
+        with self._lock:
+            if self._model is None:
+                from fastembed import TextEmbedding
+                self._model = TextEmbedding(self.MODEL_NAME)
+
+            vector = np.asarray(next(iter(self._model.embed([text]))), dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def _ensure_index(self, resume_hash: str, prompt_version: int):
+        """Load the stored embeddings for this resume and prompt version; call under the lock."""
+        if self._index_key == (resume_hash, prompt_version):
+            return
+
+        rows = self.repository.get_cover_letter_embeddings(resume_hash, prompt_version)
+        self._matrix = (
+            np.vstack([np.frombuffer(embedding, dtype=np.float32) for embedding, _, _ in rows])
+            if rows else None
+        )
+        self._companies = [company for _, company, _ in rows]
+        self._letters = [content for _, _, content in rows]
+        self._index_key = (resume_hash, prompt_version)
+
+    def lookup(
+        self,
+        embedding: np.ndarray,
+        company: str,
+        resume_hash: str,
+        prompt_version: int
+    ) -> Optional[str]:
+        """Return the letter of the most similar cached job above the threshold."""
+        with self._lock:
+            self._ensure_index(resume_hash, prompt_version)
+            if self._matrix is None:
+                return None
+
+            scores = self._matrix @ embedding
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+            letter = self._letters[best]
+            cached_company = self._companies[best]
+
+        console.print(f"[dim]Reusing cover letter of a similar job (similarity {scores[best]:.2f})[/dim]")
+        if cached_company and cached_company != company:
+            letter = letter.replace(cached_company, company)
+        return letter
+
+    def add(
+        self,
+        embedding: np.ndarray,
+        company: str,
+        letter: str,
+        resume_hash: str,
+        prompt_version: int
+    ):
+        """Append a newly cached letter to the in-memory index."""
+        with self._lock:
+            if self._index_key != (resume_hash, prompt_version):
+                return  # Loaded from the database on the next lookup
+
+            row = embedding[np.newaxis, :]
+            self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+            self._companies.append(company)
+            self._letters.append(letter)
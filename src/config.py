@@ -1,8 +1,9 @@
 """Configuration management for LinkedIn Job Bot."""
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from pydantic import Field
+from typing import Optional, Tuple
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings
 from enum import Enum
 
@@ -55,6 +56,11 @@ class Settings(BaseSettings):
     # Auto Apply Settings
     auto_apply_enabled: bool = Field(default=False, description="Enable auto-apply")
     max_applications_per_run: int = Field(default=10, description="Max applications per run")
+    max_concurrent_applications: int = Field(
+        default=2,
+        description="Applications filled in parallel, each in its own browser context"
+    )
+    applications_per_minute: int = Field(default=8, description="Max applications started per minute")
     
     # Resume/CV Configuration
     resume_path: str = Field(default="./resumes/my_resume.pdf", description="Path to resume")
@@ -65,12 +71,47 @@ class Settings(BaseSettings):
     
     # LLM Configuration
     llm_provider: LLMProvider = Field(default=LLMProvider.OLLAMA, description="LLM provider")
+    llm_providers: str = Field(
+        default="",
+        description="Comma-separated providers to rotate through, with failover (default: llm_provider)"
+    )
     ollama_base_url: str = Field(default="http://localhost:11434", description="Ollama API URL")
     ollama_model: str = Field(default="llama2", description="Ollama model name")
     ollama_api_key: Optional[str] = Field(default=None, description="Ollama API key (for remote servers)")
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
     groq_api_key: Optional[str] = Field(default=None, description="Groq API key")
     google_ai_api_key: Optional[str] = Field(default=None, description="Google AI API key")
+    llm_max_concurrency: int = Field(default=4, description="Max concurrent requests per LLM provider")
+    ollama_rpm: int = Field(default=0, description="Ollama requests per minute (0 = unlimited)")
+    groq_rpm: int = Field(default=30, description="Groq requests per minute")
+    openai_rpm: int = Field(default=60, description="OpenAI requests per minute")
+    google_rpm: int = Field(default=60, description="Google AI requests per minute")
+    llm_connect_timeout_s: float = Field(default=5.0, description="Seconds to connect to an LLM provider")
+    llm_read_timeout_s: float = Field(default=45.0, description="Seconds to wait for LLM response data")
+    ollama_read_timeout_s: float = Field(
+        default=60.0,
+        description="Read timeout for Ollama, which may load the model before the first token"
+    )
+    cover_letter_batch_size: int = Field(
+        default=0,
+        description="Pre-generate cover letters this many jobs per LLM request (0 = on demand)"
+    )
+    cover_letter_prefetch: bool = Field(
+        default=True,
+        description="Generate cover letters in the background while the browser works through jobs"
+    )
+    openai_batch_mode: bool = Field(
+        default=False,
+        description="Queue cover letters through OpenAI's Batch API between runs (50% cheaper)"
+    )
+    cover_letter_semantic_cache: bool = Field(
+        default=False,
+        description="Reuse cover letters of near-duplicate jobs (needs fastembed)"
+    )
+    cover_letter_similarity_threshold: float = Field(
+        default=0.93,
+        description="Cosine similarity needed to reuse a near-duplicate's cover letter"
+    )
     
     # Scheduler Settings
     scheduler_start_hour: int = Field(default=8, description="Scheduler start hour (24h)")
@@ -86,26 +127,68 @@ class Settings(BaseSettings):
     # Browser Settings
     headless: bool = Field(default=True, description="Run browser in headless mode")
     slow_mo: int = Field(default=100, description="Slow motion delay in ms")
+    session_ttl_seconds: int = Field(
+        default=3600,
+        description="Trust a saved LinkedIn session this recent without checking the feed"
+    )
+    block_heavy_resources: bool = Field(
+        default=True,
+        description="Skip images, fonts, media and trackers in headless runs"
+    )
+    action_timeout_ms: int = Field(default=5000, description="Default wait for page elements and actions in ms")
+    navigation_timeout_ms: int = Field(default=15000, description="Default wait for page loads in ms")
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
     
-    @property
-    def keywords_list(self) -> List[str]:
-        """Get job keywords as a list."""
-        return [k.strip() for k in self.job_keywords.split(",") if k.strip()]
+    # Parsed forms of the comma-separated fields, computed once in model_post_init
+    # Tuples, since the cached settings object is shared by the whole process
+    _keywords: Tuple[str, ...] = PrivateAttr(default=())
+    _experience_levels: Tuple[ExperienceLevel, ...] = PrivateAttr(default=())
+    _llm_providers: Tuple[LLMProvider, ...] = PrivateAttr(default=())
     
-    @property
-    def experience_levels_list(self) -> List[ExperienceLevel]:
-        """Get experience levels as a list of enums."""
+    def model_post_init(self, __context):
+        """Parse the comma-separated settings once."""
+        self._keywords = tuple(k.strip() for k in self.job_keywords.split(",") if k.strip())
+        
         levels = []
         for level in self.experience_levels.split(","):
             level = level.strip().upper()
             if hasattr(ExperienceLevel, level):
                 levels.append(ExperienceLevel[level])
-        return levels
+        self._experience_levels = tuple(levels)
+        
+        providers = []
+        for name in self.llm_providers.split(","):
+            name = name.strip().lower()
+            if name in LLMProvider._value2member_map_ and LLMProvider(name) not in providers:
+                providers.append(LLMProvider(name))
+        self._llm_providers = tuple(providers)
+    
+    @property
+    def keywords_list(self) -> Tuple[str, ...]:
+        """Get job keywords as a tuple."""
+        return self._keywords
+    
+    @property
+    def experience_levels_list(self) -> Tuple[ExperienceLevel, ...]:
+        """Get experience levels as a tuple of enums."""
+        return self._experience_levels
+    
+    @property
+    def llm_providers_list(self) -> Tuple[LLMProvider, ...]:
+        """Get the LLM providers to rotate through, primary first."""
+        return self._llm_providers or (self.llm_provider,)
+    
+    def llm_rpm(self, provider: LLMProvider) -> int:
+        """Get the requests-per-minute limit for an LLM provider (0 = unlimited)."""
+        return getattr(self, f"{provider.value}_rpm", 0)
+    
+    def llm_read_timeout(self, provider: LLMProvider) -> float:
+        """Get the read timeout for an LLM provider, falling back to llm_read_timeout_s."""
+        return getattr(self, f"{provider.value}_read_timeout_s", self.llm_read_timeout_s)
     
     @property
     def date_posted_filter(self) -> DatePosted:
@@ -116,10 +199,8 @@ class Settings(BaseSettings):
         return DatePosted.PAST_WEEK
 
 
-# Global settings instance
-settings = Settings()
-
-
+# One settings instance per process
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the application settings."""
-    return settings
+    """Get the application settings, loaded from the environment once per process."""
+    return Settings()
@@ -1,5 +1,8 @@
 """Database module for LinkedIn Job Bot."""
-from .models import Job, Application, Base, ApplicationStatus
+from .models import Job, Application, Base, ApplicationStatus, CachedCoverLetter, CoverLetterBatch
 from .repository import JobRepository
 
-__all__ = ["Job", "Application", "Base", "ApplicationStatus", "JobRepository"]
+__all__ = [
+    "Job", "Application", "Base", "ApplicationStatus", "CachedCoverLetter",
+    "CoverLetterBatch", "JobRepository"
+]
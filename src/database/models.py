@@ -1,9 +1,10 @@
 """Database models for storing job listings and applications."""
+import operator
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     create_engine, Column, Integer, String, Text, DateTime, 
-    Boolean, ForeignKey, Enum as SQLEnum
+    Boolean, ForeignKey, Index, LargeBinary, Enum as SQLEnum
 )
 from sqlalchemy.orm import declarative_base, relationship
 from enum import Enum
@@ -22,9 +23,27 @@ class ApplicationStatus(str, Enum):
     FAILED = "failed"
 
 
+# Attributes serialized by to_dict, fetched with one attrgetter call
+_JOB_FIELDS = (
+    "id", "linkedin_job_id", "title", "company", "location", "description",
+    "job_url", "posted_date", "posted_at", "experience_level", "employment_type", "salary_range",
+    "applicant_count", "is_easy_apply", "scraped_at", "search_keyword",
+)
+_JOB_GETTER = operator.attrgetter(*_JOB_FIELDS)
+_APPLICATION_FIELDS = (
+    "id", "job_id", "status", "applied_at", "cover_letter", "resume_used",
+    "notes", "error_message",
+)
+_APPLICATION_GETTER = operator.attrgetter(*_APPLICATION_FIELDS)
+
+
 class Job(Base):
     """Model representing a LinkedIn job listing."""
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Unapplied Easy Apply jobs, newest first
+        Index("ix_jobs_easyapply_scraped", "is_easy_apply", "scraped_at"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     linkedin_job_id = Column(String(50), unique=True, nullable=False, index=True)
@@ -34,6 +53,7 @@ class Job(Base):
     description = Column(Text)
     job_url = Column(String(1000))
     posted_date = Column(String(100))
+    posted_at = Column(DateTime)  # posted_date resolved when scraped
     experience_level = Column(String(50))
     employment_type = Column(String(50))
     salary_range = Column(String(200))
@@ -52,28 +72,19 @@ class Job(Base):
     
     def to_dict(self) -> dict:
         """Convert job to dictionary."""
-        return {
-            "id": self.id,
-            "linkedin_job_id": self.linkedin_job_id,
-            "title": self.title,
-            "company": self.company,
-            "location": self.location,
-            "description": self.description,
-            "job_url": self.job_url,
-            "posted_date": self.posted_date,
-            "experience_level": self.experience_level,
-            "employment_type": self.employment_type,
-            "salary_range": self.salary_range,
-            "applicant_count": self.applicant_count,
-            "is_easy_apply": self.is_easy_apply,
-            "scraped_at": self.scraped_at.isoformat() if self.scraped_at else None,
-            "search_keyword": self.search_keyword,
-        }
+        data = dict(zip(_JOB_FIELDS, _JOB_GETTER(self)))
+        data["scraped_at"] = self.scraped_at.isoformat() if self.scraped_at else None
+        data["posted_at"] = self.posted_at.isoformat() if self.posted_at else None
+        return data
 
 
 class Application(Base):
     """Model representing a job application."""
     __tablename__ = "applications"
+    __table_args__ = (
+        # Covers the "already applied" subquery: status filter, job_id output
+        Index("ix_apps_status_jobid", "status", "job_id"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False)
@@ -92,13 +103,43 @@ class Application(Base):
     
     def to_dict(self) -> dict:
         """Convert application to dictionary."""
-        return {
-            "id": self.id,
-            "job_id": self.job_id,
-            "status": self.status,
-            "applied_at": self.applied_at.isoformat() if self.applied_at else None,
-            "cover_letter": self.cover_letter,
-            "resume_used": self.resume_used,
-            "notes": self.notes,
-            "error_message": self.error_message,
-        }
+        data = dict(zip(_APPLICATION_FIELDS, _APPLICATION_GETTER(self)))
+        data["applied_at"] = self.applied_at.isoformat() if self.applied_at else None
+        return data
+
+
+class CachedCoverLetter(Base):
+    """Model caching a generated cover letter for a job/resume/prompt combination."""
+    __tablename__ = "cover_letters"
+    
+    job_hash = Column(String(128), primary_key=True)
+    resume_hash = Column(String(128), primary_key=True)
+    prompt_version = Column(Integer, primary_key=True)
+    content = Column(Text, nullable=False)
+    company = Column(String(300))
+    embedding = Column(LargeBinary)  # float32 job text embedding, if computed
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<CachedCoverLetter(job_hash='{self.job_hash[:12]}', prompt_version={self.prompt_version})>"
+
+
+class CoverLetterBatch(Base):
+    """Model tracking an offline (OpenAI Batch API) cover letter request."""
+    __tablename__ = "cover_letter_batches"
+    
+    batch_id = Column(String(100), primary_key=True)
+    resume_hash = Column(String(128), nullable=False)
+    prompt_version = Column(Integer, nullable=False)
+    job_ids = Column(Text, nullable=False)  # Comma-separated Job.id values
+    status = Column(String(30), default="submitted")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    completed_at = Column(DateTime)
+    
+    @property
+    def job_id_list(self) -> list:
+        """Job IDs covered by this batch."""
+        return [int(job_id) for job_id in self.job_ids.split(",") if job_id]
+    
+    def __repr__(self):
+        return f"<CoverLetterBatch(batch_id='{self.batch_id}', status='{self.status}')>"
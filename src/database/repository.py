@@ -1,15 +1,95 @@
 """Database repository for job operations."""
 import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from sqlalchemy import create_engine
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import create_engine, event, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 
-from .models import Base, Job, Application, ApplicationStatus
+from .models import Base, Job, Application, ApplicationStatus, CachedCoverLetter, CoverLetterBatch
 from ..config import get_settings
 
 
+# Counters kept in step with jobs/applications by triggers, so stats are O(1)
+STATS_COUNTERS_DDL = [
+    """CREATE TABLE stats_counters (
+        name TEXT PRIMARY KEY,
+        n INTEGER NOT NULL DEFAULT 0
+    )""",
+    """INSERT INTO stats_counters (name, n)
+        SELECT 'total_jobs', COUNT(*) FROM jobs""",
+    """INSERT INTO stats_counters (name, n)
+        SELECT 'total_applications', COUNT(*) FROM applications""",
+    """INSERT INTO stats_counters (name, n)
+        SELECT status, COUNT(*) FROM applications WHERE status IS NOT NULL GROUP BY status""",
+    """CREATE TRIGGER stats_jobs_insert AFTER INSERT ON jobs BEGIN
+        UPDATE stats_counters SET n = n + 1 WHERE name = 'total_jobs';
+    END""",
+    """CREATE TRIGGER stats_jobs_delete AFTER DELETE ON jobs BEGIN
+        UPDATE stats_counters SET n = n - 1 WHERE name = 'total_jobs';
+    END""",
+    """CREATE TRIGGER stats_applications_insert AFTER INSERT ON applications BEGIN
+        UPDATE stats_counters SET n = n + 1 WHERE name = 'total_applications';
+        INSERT INTO stats_counters (name, n) VALUES (NEW.status, 1)
+            ON CONFLICT(name) DO UPDATE SET n = n + 1;
+    END""",
+    """CREATE TRIGGER stats_applications_update AFTER UPDATE OF status ON applications
+    WHEN OLD.status IS NOT NEW.status BEGIN
+        UPDATE stats_counters SET n = n - 1 WHERE name = OLD.status;
+        INSERT INTO stats_counters (name, n) VALUES (NEW.status, 1)
+            ON CONFLICT(name) DO UPDATE SET n = n + 1;
+    END""",
+    """CREATE TRIGGER stats_applications_delete AFTER DELETE ON applications BEGIN
+        UPDATE stats_counters SET n = n - 1 WHERE name = 'total_applications';
+        UPDATE stats_counters SET n = n - 1 WHERE name = OLD.status;
+    END""",
+]
+
+# External-content FTS5 index over the jobs table, synced by triggers
+JOBS_FTS_DDL = [
+    """CREATE VIRTUAL TABLE jobs_fts USING fts5(
+        title, company, description, content='jobs', content_rowid='id'
+    )""",
+    """INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')""",
+    """CREATE TRIGGER jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.description);
+    END""",
+    """CREATE TRIGGER jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.description);
+    END""",
+    """CREATE TRIGGER jobs_fts_update AFTER UPDATE OF title, company, description ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+            VALUES ('delete', OLD.id, OLD.title, OLD.company, OLD.description);
+        INSERT INTO jobs_fts (rowid, title, company, description)
+            VALUES (NEW.id, NEW.title, NEW.company, NEW.description);
+    END""",
+]
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING ... RETURNING
+_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = WAL")  # Readers don't block the writer
+    cursor.execute("PRAGMA synchronous = NORMAL")  # fsync at checkpoints, not every commit
+    cursor.execute("PRAGMA cache_size = -20000")  # ~20 MB page cache
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+    cursor.close()
+
+
 class JobRepository:
     """Repository for job and application database operations."""
     
@@ -19,14 +99,71 @@ class JobRepository:
         self.database_url = database_url or settings.database_url
         
         # Ensure data directory exists
-        if self.database_url.startswith("sqlite:///"):
+        if self.database_url.startswith("sqlite:///") and self.database_url != "sqlite:///:memory:":
             db_path = self.database_url.replace("sqlite:///", "")
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        self.engine = create_engine(self.database_url, echo=False)
+        engine_args = {}
+        if self.database_url.startswith("sqlite"):
+            # Pooled connections move between threads; wait on locks instead of failing
+            engine_args["connect_args"] = {"check_same_thread": False, "timeout": 30}
+            if self.database_url in ("sqlite://", "sqlite:///:memory:"):
+                # An in-memory database lives in its connection, so every session shares one
+                engine_args["poolclass"] = StaticPool
+        self.engine = create_engine(self.database_url, echo=False, **engine_args)
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
+        self._add_missing_columns()
+        self._create_missing_indexes()
+        self.has_stats_counters = False
+        self.has_fts = False
+        if self.engine.dialect.name == "sqlite":
+            self._create_sqlite_extras()
         self.SessionLocal = sessionmaker(bind=self.engine)
     
+    def _add_missing_columns(self):
+        """Add columns introduced after an existing table was created."""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        column_type = column.type.compile(dialect=self.engine.dialect)
+                        conn.execute(text(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+                        ))
+    
+    def _create_missing_indexes(self):
+        """Create indexes introduced after an existing table was created."""
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+    
+    def _create_sqlite_extras(self):
+        """Create the stats counters and the jobs FTS index if they don't exist yet."""
+        existing = set(inspect(self.engine).get_table_names())
+        
+        for table_name, statements in (
+            ("stats_counters", STATS_COUNTERS_DDL),
+            ("jobs_fts", JOBS_FTS_DDL),
+        ):
+            if table_name not in existing:
+                try:
+                    with self.engine.begin() as conn:
+                        for statement in statements:
+                            conn.execute(text(statement))
+                except OperationalError:
+                    # e.g. SQLite built without FTS5; queries fall back to scans
+                    continue
+            
+            if table_name == "stats_counters":
+                self.has_stats_counters = True
+            else:
+                self.has_fts = True
+    
     def get_session(self) -> Session:
         """Get a new database session."""
         return self.SessionLocal()
@@ -40,41 +177,68 @@ class JobRepository:
                 Job.linkedin_job_id == linkedin_job_id
             ).first() is not None
     
+    def existing_ids(self, linkedin_job_ids: Iterable[str]) -> Set[str]:
+        """Return which of the given LinkedIn job IDs are already stored, in one query."""
+        ids = list(linkedin_job_ids)
+        if not ids:
+            return set()
+        with self.get_session() as session:
+            return set(session.scalars(
+                select(Job.linkedin_job_id).where(Job.linkedin_job_id.in_(ids))
+            ))
+    
     def add_job(self, job_data: dict) -> Optional[Job]:
         """Add a new job to the database if it doesn't exist."""
-        if self.job_exists(job_data.get("linkedin_job_id", "")):
-            return None
-        
-        with self.get_session() as session:
-            job = Job(**job_data)
-            session.add(job)
-            session.commit()
-            session.refresh(job)
-            return job
+        added = self.add_jobs_batch([job_data])
+        return added[0] if added else None
     
     def add_jobs_batch(self, jobs_data: List[dict]) -> List[Job]:
         """Add multiple jobs, skipping duplicates."""
-        added_jobs = []
-        with self.get_session() as session:
-            for job_data in jobs_data:
-                linkedin_job_id = job_data.get("linkedin_job_id", "")
-                
-                # Check if already exists
-                existing = session.query(Job).filter(
-                    Job.linkedin_job_id == linkedin_job_id
-                ).first()
-                
-                if not existing:
-                    job = Job(**job_data)
-                    session.add(job)
-                    added_jobs.append(job)
+        # Drop repeats within the batch; the first occurrence wins
+        unique = {}
+        for job_data in jobs_data:
+            unique.setdefault(job_data.get("linkedin_job_id", ""), job_data)
+        if not unique:
+            return []
+        
+        with self.get_session() as session:
+            if self.engine.dialect.name not in _UPSERT_INSERTS:
+                return self._add_jobs_checked(session, list(unique.values()))
             
+            insert = _UPSERT_INSERTS[self.engine.dialect.name]
+            # executemany needs the same keys in every row, so insert per key set
+            groups = {}
+            for job_data in unique.values():
+                groups.setdefault(frozenset(job_data), []).append(job_data)
+            
+            added_jobs = []
+            for rows in groups.values():
+                stmt = insert(Job).on_conflict_do_nothing(
+                    index_elements=[Job.linkedin_job_id]
+                ).returning(Job)
+                added_jobs.extend(session.scalars(stmt, rows).all())
+            
+            # RETURNING loaded every column; detach so commit doesn't expire them
+            session.expunge_all()
             session.commit()
-            for job in added_jobs:
-                session.refresh(job)
         
         return added_jobs
     
+    def _add_jobs_checked(self, session: Session, jobs_data: List[dict]) -> List[Job]:
+        """Insert jobs missing from the database, for dialects without upserts."""
+        existing = self.existing_ids(job_data.get("linkedin_job_id", "") for job_data in jobs_data)
+        
+        added_jobs = [
+            Job(**job_data) for job_data in jobs_data
+            if job_data.get("linkedin_job_id", "") not in existing
+        ]
+        session.add_all(added_jobs)
+        # Flush assigns ids; detach so commit doesn't expire what we return
+        session.flush()
+        session.expunge_all()
+        session.commit()
+        return added_jobs
+    
     def get_job_by_linkedin_id(self, linkedin_job_id: str) -> Optional[Job]:
         """Get a job by its LinkedIn job ID."""
         with self.get_session() as session:
@@ -82,12 +246,12 @@ class JobRepository:
                 Job.linkedin_job_id == linkedin_job_id
             ).first()
     
-    def get_all_jobs(self, limit: int = 100, offset: int = 0) -> List[Job]:
-        """Get all jobs with pagination."""
+    def get_all_jobs(self, limit: int = 100, offset: int = 0) -> Iterator[Job]:
+        """Stream jobs, newest first, with pagination."""
         with self.get_session() as session:
-            return session.query(Job).order_by(
+            yield from session.query(Job).order_by(
                 Job.scraped_at.desc()
-            ).offset(offset).limit(limit).all()
+            ).offset(offset).limit(limit).yield_per(500)
     
     def get_unapplied_easy_apply_jobs(self, limit: int = 10) -> List[Job]:
         """Get jobs with Easy Apply that haven't been applied to."""
@@ -107,13 +271,33 @@ class JobRepository:
                 ~Job.id.in_(applied_job_ids)
             ).order_by(Job.scraped_at.desc()).limit(limit).all()
     
+    def get_jobs_by_ids(self, job_ids: List[int]) -> List[Job]:
+        """Get the jobs with the given database IDs."""
+        if not job_ids:
+            return []
+        with self.get_session() as session:
+            return session.query(Job).filter(Job.id.in_(job_ids)).all()
+    
     def get_job_count(self) -> int:
         """Get total number of jobs in database."""
         with self.get_session() as session:
             return session.query(Job).count()
     
     def search_jobs(self, keyword: str, limit: int = 50) -> List[Job]:
-        """Search jobs by keyword in title or company."""
+        """Search jobs by keyword in title, company or description."""
+        # Quote each word so user input can't be read as FTS syntax; prefix-match it
+        terms = re.findall(r"\w+", keyword)
+        if self.has_fts and terms:
+            query = " ".join(f'"{term}"*' for term in terms)
+            with self.get_session() as session:
+                return session.scalars(
+                    select(Job).from_statement(text(
+                        "SELECT jobs.* FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid "
+                        "WHERE jobs_fts MATCH :query ORDER BY jobs_fts.rank LIMIT :limit"
+                    )),
+                    {"query": query, "limit": limit}
+                ).all()
+        
         with self.get_session() as session:
             return session.query(Job).filter(
                 (Job.title.ilike(f"%{keyword}%")) |
@@ -171,6 +355,31 @@ class JobRepository:
             
             return application
     
+    def record_applications(
+        self,
+        entries: List[Tuple[int, Optional[str], ApplicationStatus, Optional[str]]]
+    ):
+        """Insert finished (job_id, resume_used, status, error_message) applications in one commit."""
+        if not entries:
+            return
+        
+        now = datetime.utcnow()
+        with self.get_session() as session:
+            session.add_all([
+                Application(
+                    job_id=job_id,
+                    status=status.value,
+                    resume_used=resume_used,
+                    error_message=error_message,
+                    applied_at=now if status in [
+                        ApplicationStatus.APPLIED,
+                        ApplicationStatus.EASY_APPLY
+                    ] else None
+                )
+                for job_id, resume_used, status, error_message in entries
+            ])
+            session.commit()
+    
     def get_application_for_job(self, job_id: int) -> Optional[Application]:
         """Get application for a specific job."""
         with self.get_session() as session:
@@ -192,23 +401,114 @@ class JobRepository:
     def get_application_stats(self) -> dict:
         """Get application statistics."""
         with self.get_session() as session:
-            stats = {
-                "total_jobs": session.query(Job).count(),
-                "total_applications": session.query(Application).count(),
-                "applied": session.query(Application).filter(
-                    Application.status == ApplicationStatus.APPLIED.value
-                ).count(),
-                "easy_apply": session.query(Application).filter(
-                    Application.status == ApplicationStatus.EASY_APPLY.value
-                ).count(),
-                "pending": session.query(Application).filter(
-                    Application.status == ApplicationStatus.PENDING.value
-                ).count(),
-                "skipped": session.query(Application).filter(
-                    Application.status == ApplicationStatus.SKIPPED.value
-                ).count(),
-                "failed": session.query(Application).filter(
-                    Application.status == ApplicationStatus.FAILED.value
-                ).count(),
-            }
-            return stats
+            if self.has_stats_counters:
+                counters = dict(session.execute(text("SELECT name, n FROM stats_counters")).all())
+            else:
+                counters = dict(
+                    session.query(Application.status, func.count(Application.id))
+                    .group_by(Application.status)
+                    .all()
+                )
+                counters["total_applications"] = sum(counters.values())
+                counters["total_jobs"] = session.query(func.count(Job.id)).scalar()
+        
+        return {
+            "total_jobs": counters.get("total_jobs", 0),
+            "total_applications": counters.get("total_applications", 0),
+            "applied": counters.get(ApplicationStatus.APPLIED.value, 0),
+            "easy_apply": counters.get(ApplicationStatus.EASY_APPLY.value, 0),
+            "pending": counters.get(ApplicationStatus.PENDING.value, 0),
+            "skipped": counters.get(ApplicationStatus.SKIPPED.value, 0),
+            "failed": counters.get(ApplicationStatus.FAILED.value, 0),
+        }
+    
+    # ==================== Cover Letter Cache ====================
+    
+    def get_cached_cover_letter(
+        self,
+        job_hash: str,
+        resume_hash: str,
+        prompt_version: int
+    ) -> Optional[str]:
+        """Get a previously generated cover letter, if any."""
+        with self.get_session() as session:
+            cached = session.get(CachedCoverLetter, (job_hash, resume_hash, prompt_version))
+            return cached.content if cached else None
+    
+    def save_cover_letter(
+        self,
+        job_hash: str,
+        resume_hash: str,
+        prompt_version: int,
+        content: str,
+        company: Optional[str] = None,
+        embedding: Optional[bytes] = None
+    ):
+        """Cache a generated cover letter, replacing any previous one."""
+        with self.get_session() as session:
+            session.merge(CachedCoverLetter(
+                job_hash=job_hash,
+                resume_hash=resume_hash,
+                prompt_version=prompt_version,
+                content=content,
+                company=company,
+                embedding=embedding,
+                created_at=datetime.utcnow()
+            ))
+            session.commit()
+    
+    def get_cover_letter_embeddings(
+        self,
+        resume_hash: str,
+        prompt_version: int
+    ) -> List[Tuple[bytes, Optional[str], str]]:
+        """Get (embedding, company, content) for cached letters that have an embedding."""
+        with self.get_session() as session:
+            return [
+                (row.embedding, row.company, row.content)
+                for row in session.query(
+                    CachedCoverLetter.embedding,
+                    CachedCoverLetter.company,
+                    CachedCoverLetter.content
+                ).filter(
+                    CachedCoverLetter.resume_hash == resume_hash,
+                    CachedCoverLetter.prompt_version == prompt_version,
+                    CachedCoverLetter.embedding.isnot(None)
+                )
+            ]
+    
+    def add_cover_letter_batch(
+        self,
+        batch_id: str,
+        resume_hash: str,
+        prompt_version: int,
+        job_ids: List[int]
+    ) -> CoverLetterBatch:
+        """Record a submitted cover letter batch."""
+        with self.get_session() as session:
+            batch = CoverLetterBatch(
+                batch_id=batch_id,
+                resume_hash=resume_hash,
+                prompt_version=prompt_version,
+                job_ids=",".join(str(job_id) for job_id in job_ids)
+            )
+            session.add(batch)
+            session.commit()
+            session.refresh(batch)
+            return batch
+    
+    def get_open_cover_letter_batches(self) -> List[CoverLetterBatch]:
+        """Get submitted batches whose results have not been collected yet."""
+        with self.get_session() as session:
+            return session.query(CoverLetterBatch).filter(
+                CoverLetterBatch.completed_at.is_(None)
+            ).order_by(CoverLetterBatch.created_at).all()
+    
+    def finish_cover_letter_batch(self, batch_id: str, status: str):
+        """Mark a batch as done (completed, failed, expired or cancelled)."""
+        with self.get_session() as session:
+            batch = session.get(CoverLetterBatch, batch_id)
+            if batch:
+                batch.status = status
+                batch.completed_at = datetime.utcnow()
+                session.commit()
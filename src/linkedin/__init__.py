@@ -2,5 +2,6 @@
 from .scraper import LinkedInScraper
 from .authenticator import LinkedInAuthenticator
 from .job_applier import JobApplier
+from .browser import BrowserPool
 
-__all__ = ["LinkedInScraper", "LinkedInAuthenticator", "JobApplier"]
+__all__ = ["LinkedInScraper", "LinkedInAuthenticator", "JobApplier", "BrowserPool"]
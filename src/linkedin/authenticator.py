@@ -1,8 +1,13 @@
 """LinkedIn authentication handler."""
 import asyncio
+import os
+import re
+import time
 from pathlib import Path
 from typing import Optional
-from playwright.async_api import Page, Browser, BrowserContext, async_playwright
+import orjson
+from playwright.async_api import Page, Browser, BrowserContext, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from rich.console import Console
 
 from ..config import get_settings
@@ -17,12 +22,31 @@ class LinkedInAuthenticator:
     LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
     STORAGE_STATE_PATH = "./browser_data/linkedin_session.json"
     
+    # Nothing reads these; stylesheets stay because visibility checks need layout
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+    BLOCKED_URL_PARTS = ("doubleclick", "google-analytics", "px.ads", "licdn.com/media")
+    
+    # Hides automation markers; registered on the context so every page gets it
+    STEALTH_JS = """
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+        Object.defineProperty(navigator, 'plugins', {
+            get: () => [1, 2, 3, 4, 5]
+        });
+        Object.defineProperty(navigator, 'languages', {
+            get: () => ['en-US', 'en']
+        });
+        window.chrome = { runtime: {} };
+    """
+    
     def __init__(self):
         """Initialize authenticator."""
         self.settings = get_settings()
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self._owns_context = True
         
         # Ensure storage directory exists
         Path(self.STORAGE_STATE_PATH).parent.mkdir(parents=True, exist_ok=True)
@@ -66,37 +90,58 @@ class LinkedInAuthenticator:
             }
         }
         
+        if storage_path.exists():
+            try:
+                orjson.loads(storage_path.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                console.print("[yellow]Saved session is unreadable, discarding it[/yellow]")
+                storage_path.unlink(missing_ok=True)
+        
         if storage_path.exists():
             console.print("[cyan]Loading saved session...[/cyan]")
             context_options['storage_state'] = str(storage_path)
-            self.context = await self.browser.new_context(**context_options)
+            context = await self.browser.new_context(**context_options)
         else:
             console.print("[yellow]No saved session found, creating new context...[/yellow]")
-            self.context = await self.browser.new_context(**context_options)
+            context = await self.browser.new_context(**context_options)
+        
+        # Fail fast when a selector is gone; waits that need longer pass their own timeout
+        context.set_default_timeout(self.settings.action_timeout_ms)
+        context.set_default_navigation_timeout(self.settings.navigation_timeout_ms)
         
-        return self.context
+        # Pooled contexts open pages the authenticator never sees
+        await context.add_init_script(self.STEALTH_JS)
+        
+        # Headed runs may need images, e.g. to solve a security challenge by hand
+        if self.settings.block_heavy_resources and self.settings.headless:
+            await context.route("**/*", self._route_request)
+        
+        # Pools open several contexts concurrently, so hand back this call's own one
+        self.context = context
+        return context
+    
+    async def _route_request(self, route: Route):
+        """Abort images, fonts, media and trackers; let everything else through."""
+        request = route.request
+        if (
+            request.resource_type in self.BLOCKED_RESOURCE_TYPES
+            or any(part in request.url for part in self.BLOCKED_URL_PARTS)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def use_context(self, context: BrowserContext):
+        """Work inside a context owned by someone else (left open on close)."""
+        self.context = context
+        self._owns_context = False
     
     async def is_logged_in(self, page: Page) -> bool:
         """Check if user is currently logged in to LinkedIn."""
         try:
-            # Add stealth scripts before navigation
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-                window.chrome = { runtime: {} };
-            """)
-            
             await page.goto(self.LINKEDIN_FEED_URL, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)
             
-            # Check for feed elements that indicate logged-in state
+            # Check for feed elements that indicate logged-in state (waits for them to render)
             feed_selector = ".feed-shared-update-v2, .scaffold-layout__main, nav.global-nav"
             try:
                 await page.wait_for_selector(feed_selector, timeout=8000)
@@ -117,7 +162,7 @@ class LinkedInAuthenticator:
         
         try:
             await page.goto(self.LINKEDIN_LOGIN_URL, wait_until="domcontentloaded")
-            await page.wait_for_timeout(2000)
+            await page.wait_for_selector("#username", timeout=5000)
             
             # Fill in credentials
             email_input = page.locator("#username")
@@ -129,8 +174,11 @@ class LinkedInAuthenticator:
             # Click sign in button
             await page.locator('button[type="submit"]').click()
             
-            # Wait for navigation
-            await page.wait_for_timeout(5000)
+            # Wait for the redirect to the feed or a security check
+            try:
+                await page.wait_for_url(re.compile(r"feed|checkpoint|challenge"), timeout=15000)
+            except PlaywrightTimeoutError:
+                pass  # Still on the login page; is_logged_in reports the failure
             
             # Check for security challenges
             if "checkpoint" in page.url or "challenge" in page.url:
@@ -138,11 +186,10 @@ class LinkedInAuthenticator:
                 console.print("[yellow]Please complete the verification manually...[/yellow]")
                 
                 # Wait for manual verification (up to 2 minutes)
-                for i in range(24):
-                    await page.wait_for_timeout(5000)
-                    if "feed" in page.url or "jobs" in page.url:
-                        break
-                    console.print(f"[yellow]Waiting for verification... ({(i+1)*5}s)[/yellow]")
+                try:
+                    await page.wait_for_url(re.compile(r"feed|jobs"), timeout=120_000)
+                except PlaywrightTimeoutError:
+                    console.print("[yellow]Verification not completed within 2 minutes[/yellow]")
             
             # Verify login success
             if await self.is_logged_in(page):
@@ -161,13 +208,15 @@ class LinkedInAuthenticator:
     async def save_session(self):
         """Save the current session state."""
         if self.context:
-            await self.context.storage_state(path=self.STORAGE_STATE_PATH)
+            # Write aside and swap in, so a crash mid-write never leaves a truncated session
+            temp_path = f"{self.STORAGE_STATE_PATH}.tmp"
+            await self.context.storage_state(path=temp_path)
+            os.replace(temp_path, self.STORAGE_STATE_PATH)
             console.print("[green]Session saved successfully.[/green]")
     
     def is_session_file_valid(self) -> bool:
         """Check if session file exists and is not too old."""
         from datetime import datetime, timedelta
-        import json
         
         storage_path = Path(self.STORAGE_STATE_PATH)
         if not storage_path.exists():
@@ -181,37 +230,43 @@ class LinkedInAuthenticator:
                 return False
             
             # Check if file is valid JSON
-            with open(storage_path, 'r') as f:
-                data = json.load(f)
-                if not data.get('cookies'):
-                    console.print("[yellow]Session file has no cookies[/yellow]")
-                    return False
+            data = orjson.loads(storage_path.read_bytes())
+            if not data.get('cookies'):
+                console.print("[yellow]Session file has no cookies[/yellow]")
+                return False
             
             return True
         except Exception as e:
             console.print(f"[yellow]Session file validation failed: {e}[/yellow]")
             return False
     
+    async def has_fresh_session(self) -> bool:
+        """Whether the session file is younger than the TTL and its login cookie is in this context."""
+        try:
+            age = time.time() - Path(self.STORAGE_STATE_PATH).stat().st_mtime
+        except OSError:
+            return False
+        if age >= self.settings.session_ttl_seconds:
+            return False
+        
+        cookies = await self.context.cookies("https://www.linkedin.com")
+        return any(cookie["name"] == "li_at" for cookie in cookies)
+    
     async def ensure_logged_in(self) -> Page:
         """Ensure user is logged in and return the page."""
         if not self.context:
             raise RuntimeError("Browser context not initialized. Call get_context() first.")
         
-        self.page = await self.context.new_page()
-        
-        # Add stealth scripts to every page
-        await self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-            window.chrome = { runtime: {} };
-        """)
+        # A page left open in this context was set up by an earlier call
+        if self.context.pages:
+            self.page = self.context.pages[0]
+        else:
+            self.page = await self.context.new_page()
+        
+        # A recently saved session is trusted without loading the feed
+        if await self.has_fresh_session():
+            console.print("[green]Using saved session.[/green]")
+            return self.page
         
         if await self.is_logged_in(self.page):
             console.print("[green]Already logged in.[/green]")
@@ -233,6 +288,9 @@ class LinkedInAuthenticator:
         """Close browser and cleanup."""
         if self.page:
             await self.page.close()
+            self.page = None
+        if not self._owns_context:
+            return
         if self.context:
             await self.context.close()
         if self.browser:
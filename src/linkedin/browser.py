@@ -0,0 +1,100 @@
+"""Shared Playwright browser for LinkedIn automation."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from .authenticator import LinkedInAuthenticator
+
+
+class BrowserPool:
+    """Owns one browser for a whole pipeline run and lends out session contexts.
+
+    Launching Chromium costs seconds, a new context milliseconds, so workers
+    share the browser and each borrows its own context (cookies, tabs).
+    Released contexts are kept and handed to the next borrower.
+    """
+
+    def __init__(self):
+        """Initialize the pool; the browser starts on entry."""
+        self.auth = LinkedInAuthenticator()
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._contexts: List[BrowserContext] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    async def __aenter__(self) -> "BrowserPool":
+        """Launch Playwright and the browser."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close every context, the browser and Playwright."""
+        await self.close()
+
+    async def start(self):
+        """Launch the browser if it isn't running yet."""
+        if self.browser is not None:
+            if self.browser.is_connected():
+                return
+            # Crashed while idle, e.g. between scheduled runs; drop what is left of it
+            try:
+                await self.close()
+            except Exception:
+                pass
+        self.playwright = await async_playwright().start()
+        try:
+            self.browser = await self.auth.start_browser(self.playwright)
+        except Exception:
+            await self.close()
+            raise
+
+    async def acquire(self) -> BrowserContext:
+        """Borrow an idle context, or open one with the saved LinkedIn session."""
+        if not self._idle.empty():
+            return self._idle.get_nowait()
+
+        await self.start()
+        context = await self.auth.get_context()
+        self._contexts.append(context)
+        return context
+
+    def release(self, context: BrowserContext):
+        """Return a borrowed context for reuse."""
+        self._idle.put_nowait(context)
+
+    @asynccontextmanager
+    async def context(self):
+        """Borrow a context for the duration of a block."""
+        context = await self.acquire()
+        try:
+            yield context
+        finally:
+            self.release(context)
+
+    async def close(self):
+        """Release everything this pool started."""
+        try:
+            for context in self._contexts:
+                await context.close()
+            if self.browser:
+                await self.browser.close()
+        finally:
+            self._contexts = []
+            self._idle = asyncio.Queue()
+            self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
+
+@asynccontextmanager
+async def browser_pool(pool: Optional[BrowserPool] = None):
+    """Yield the given pool, or a private one closed on exit."""
+    if pool is not None:
+        yield pool
+        return
+
+    async with BrowserPool() as own_pool:
+        yield own_pool
+
@@ -1,31 +1,208 @@
 """LinkedIn job application automation."""
 import asyncio
+import random
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict
-from playwright.async_api import Page, async_playwright
+from typing import Callable, Optional, List, Dict, Tuple
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
-from ..config import get_settings
+from ..config import get_settings, Settings
 from ..database import JobRepository, Job, ApplicationStatus
 from .authenticator import LinkedInAuthenticator
+from .browser import BrowserPool, browser_pool
+from ..rate_limiter import AsyncTokenBucket
 from ..resume_selector import get_resume_selector
 
 console = Console()
 
+# Answers for required form fields, by label pattern; the first match wins
+_FIELD_ANSWERS: List[Tuple[re.Pattern, Callable[[Settings], str]]] = [
+    (re.compile(r"year.*experience|experience.*year"), lambda settings: "3"),
+    (re.compile(r"city"), lambda settings: settings.location.split(",")[0]),
+]
+
 
 class JobApplier:
     """Automates job applications on LinkedIn."""
     
-    def __init__(self, cover_letter_generator=None):
-        """Initialize the job applier."""
+    # Timeouts on a flaky page load are retried from the job page with jittered backoff
+    MAX_ATTEMPTS = 3
+    BACKOFF_INITIAL = 2.0
+    
+    # Job page elements
+    APPLIED_SELECTOR = "[class*='applied'], .jobs-s-apply--fadein"
+    EASY_APPLY_SELECTOR = (
+        ".jobs-apply-button, "
+        "button[data-control-name='jobdetails_topcard_inapply'], "
+        "button.jobs-s-apply button, "
+        ".jobs-apply-button--top-card"
+    )
+    JOB_PAGE_READY_SELECTOR = f"{EASY_APPLY_SELECTOR}, {APPLIED_SELECTOR}"
+    
+    # Easy Apply modal elements
+    SUCCESS_SELECTOR = "[class*='post-apply'], .artdeco-modal__content h2"
+    SUBMIT_SELECTOR = (
+        "button[aria-label='Submit application'], "
+        "button[aria-label='Review'], "
+        ".jobs-easy-apply-content footer button.artdeco-button--primary"
+    )
+    NEXT_SELECTOR = "button[aria-label='Continue to next step'], button[data-easy-apply-next-button]"
+    DISMISS_SELECTOR = "button[aria-label='Dismiss'], .artdeco-modal__dismiss"
+    ERROR_SELECTOR = ".artdeco-inline-feedback--error, [class*='error']"
+    MODAL_CONTENT_SELECTOR = ".jobs-easy-apply-content, .artdeco-modal__content"
+    
+    # Application form fields
+    RESUME_INPUT_SELECTOR = "input[type='file'][name*='resume'], input[accept*='.pdf']"
+    COVER_LETTER_SELECTOR = (
+        "textarea[name*='cover'], "
+        "textarea[aria-label*='cover letter'], "
+        "textarea[id*='cover']"
+    )
+    REQUIRED_FIELDS_SELECTOR = (
+        ".jobs-easy-apply-form-section__grouping input[required], "
+        ".jobs-easy-apply-form-section__grouping select[required]"
+    )
+    FIELDSET_SELECTOR = ".jobs-easy-apply-form-section__grouping fieldset"
+    OPTION_SELECTOR = "input[type='radio'], input[type='checkbox']"
+    
+    # Any of these means the modal has rendered its current step
+    MODAL_READY_SELECTOR = ", ".join([
+        "[class*='post-apply']", SUBMIT_SELECTOR, NEXT_SELECTOR, ".artdeco-modal__dismiss"
+    ])
+    
+    # Describes the whole modal step in one round trip: what to do, which element
+    # to click and which fields to fill. Elements are tagged with data-bot-hint
+    # so each one gets a unique selector for the follow-up fill or click.
+    MODAL_PROBE_JS = """(selectors) => {
+        document.querySelectorAll("[data-bot-hint]").forEach((el) => el.removeAttribute("data-bot-hint"));
+        let tagged = 0;
+        const tag = (el) => {
+            const hint = String(tagged++);
+            el.setAttribute("data-bot-hint", hint);
+            return `[data-bot-hint="${hint}"]`;
+        };
+        const find = (selector) => document.querySelector(selector);
+        const text = (el) => (el ? el.innerText : "").toLowerCase();
+        
+        const content = find(selectors.content);
+        const snapshot = {
+            state: "idle",
+            clickSelector: null,
+            fields: [],
+            resume: find(selectors.resume) !== null,
+            coverLetter: find(selectors.coverLetter) !== null,
+            errorText: null
+        };
+        
+        const success = text(find(selectors.success));
+        const submit = find(selectors.submit);
+        const next = find(selectors.next);
+        const dismiss = find(selectors.dismiss);
+        const error = find(selectors.error);
+        
+        if (success.includes("application sent") || success.includes("applied")) {
+            snapshot.state = "done";
+        } else if (submit && text(submit).includes("submit")) {
+            snapshot.state = "submit";
+            snapshot.clickSelector = tag(submit);
+        } else if (submit && (text(submit).includes("next") || text(submit).includes("continue"))) {
+            snapshot.state = "next";
+            snapshot.clickSelector = tag(submit);
+        } else if (submit && text(submit).includes("review")) {
+            snapshot.state = "review";
+            snapshot.clickSelector = tag(submit);
+        } else if (next) {
+            snapshot.state = "next";
+            snapshot.clickSelector = tag(next);
+        } else if (dismiss && text(find(".artdeco-modal__content")).includes("application sent")) {
+            snapshot.state = "done";
+            snapshot.clickSelector = tag(dismiss);
+        } else if (error) {
+            snapshot.state = "error";
+            snapshot.errorText = error.innerText;
+        }
+        
+        if (snapshot.state === "next") {
+            for (const field of document.querySelectorAll(selectors.required)) {
+                // Selects open on a "Select an option" placeholder
+                const isSelect = field.tagName === "SELECT";
+                if (isSelect ? field.selectedIndex > 0 : field.value) continue;
+                snapshot.fields.push({
+                    selector: tag(field),
+                    kind: isSelect ? "select" : "text",
+                    hint: field.labels && field.labels.length ? text(field.labels[0]) : "",
+                    options: isSelect ? [...field.options].slice(1).map((option) => option.text.trim()) : []
+                });
+            }
+            const isYes = /^\\s*yes\\s*$/i;
+            const saysYes = (option) => isYes.test(option.value) ||
+                [...(option.labels || [])].some((label) => isYes.test(label.innerText));
+            for (const group of document.querySelectorAll(selectors.fieldset)) {
+                const legend = group.querySelector("legend");
+                if (!legend) continue;
+                const yes = [...group.querySelectorAll(selectors.option)].find(saysYes);
+                if (yes && !yes.checked) {
+                    snapshot.fields.push({selector: tag(yes), kind: "radio", hint: text(legend)});
+                }
+            }
+        }
+        
+        // Tagging is done, so this is what the page looks like right before the click
+        if (content) content.__botBefore = content.innerHTML;
+        return snapshot;
+    }"""
+    
+    MODAL_PROBE_SELECTORS = {
+        "success": SUCCESS_SELECTOR,
+        "submit": SUBMIT_SELECTOR,
+        "next": NEXT_SELECTOR,
+        "dismiss": DISMISS_SELECTOR,
+        "error": ERROR_SELECTOR,
+        "content": MODAL_CONTENT_SELECTOR,
+        "resume": RESUME_INPUT_SELECTOR,
+        "coverLetter": COVER_LETTER_SELECTOR,
+        "required": REQUIRED_FIELDS_SELECTOR,
+        "fieldset": FIELDSET_SELECTOR,
+        "option": OPTION_SELECTOR
+    }
+    
+    # Re-records the modal content after filling changed it, so the click wait sees only the step change
+    MODAL_REMEMBER_JS = """(selector) => {
+        const content = document.querySelector(selector);
+        if (content) content.__botBefore = content.innerHTML;
+    }"""
+    
+    # True once the clicked step has replaced or changed the modal content
+    MODAL_CHANGED_JS = """(selector) => {
+        const content = document.querySelector(selector);
+        return !content || content.__botBefore === undefined || content.innerHTML !== content.__botBefore;
+    }"""
+    
+    def __init__(
+        self,
+        cover_letter_generator=None,
+        pool: Optional[BrowserPool] = None,
+        repository: Optional[JobRepository] = None
+    ):
+        """Initialize the job applier, optionally inside a shared browser pool."""
         self.settings = get_settings()
+        self.pool = pool
         self.auth = LinkedInAuthenticator()
-        self.repository = JobRepository()
+        self.repository = repository or JobRepository()
         self.cover_letter_generator = cover_letter_generator
         self.resume_selector = get_resume_selector() if self.settings.use_smart_resume_selection else None
-        self.page: Optional[Page] = None
+        self._resumes: Dict[int, str] = {}  # Job.id -> selected resume path
+        self._cover_letters: Dict[int, asyncio.Task] = {}  # Job.id -> letter being generated
+        
+        # Paces applications across all workers; a burst of one per worker starts at once
+        self.rate_limiter = AsyncTokenBucket.per_minute(
+            max(1, self.settings.applications_per_minute),
+            capacity=max(1, self.settings.max_concurrent_applications)
+        )
         
         # Stats tracking
         self.stats = {
@@ -35,249 +212,225 @@ class JobApplier:
             "failed": 0
         }
     
-    async def apply_to_job(self, job: Job) -> bool:
-        """Apply to a single job using Easy Apply."""
+    async def apply_to_job(self, job: Job, page: Page) -> ApplicationStatus:
+        """Apply to a single job using Easy Apply; returns the status to record."""
         console.print(f"\n[cyan]Applying to: {job.title} at {job.company}[/cyan]")
         
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                return await self._apply_once(job, page, retry=attempt > 1)
+            except PlaywrightTimeoutError as e:
+                if attempt == self.MAX_ATTEMPTS:
+                    console.print(f"[red]Error applying to job: {e}[/red]")
+                    return ApplicationStatus.FAILED
+                delay = self.BACKOFF_INITIAL * 2 ** (attempt - 1)
+                delay += random.uniform(0, delay)
+                console.print(
+                    f"[dim]Page timed out, retrying in {delay:.1f}s ({attempt}/{self.MAX_ATTEMPTS})[/dim]"
+                )
+                await asyncio.sleep(delay)
+            except Exception as e:
+                console.print(f"[red]Error applying to job: {e}[/red]")
+                return ApplicationStatus.FAILED
+    
+    async def _apply_once(self, job: Job, page: Page, retry: bool = False) -> ApplicationStatus:
+        """One pass from the job page through the modal; Playwright timeouts propagate.
+        
+        On a retry, a job that shows as applied was submitted by the attempt that timed out.
+        """
+        # Navigate to job page
+        await page.goto(job.job_url, wait_until="domcontentloaded")
         try:
-            # Navigate to job page
-            await self.page.goto(job.job_url, wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
-            
-            # Check if already applied
-            already_applied = await self.page.query_selector(
-                "[class*='applied'], .jobs-s-apply--fadein"
-            )
-            if already_applied:
-                text = await already_applied.inner_text()
-                if "applied" in text.lower():
-                    console.print("[yellow]Already applied to this job[/yellow]")
-                    return False
-            
-            # Find Easy Apply button
-            easy_apply_btn = await self.page.query_selector(
-                ".jobs-apply-button, "
-                "button[data-control-name='jobdetails_topcard_inapply'], "
-                "button.jobs-s-apply button, "
-                ".jobs-apply-button--top-card"
-            )
-            
-            if not easy_apply_btn:
-                console.print("[yellow]No Easy Apply button found[/yellow]")
-                return False
-            
-            # Check if it's actually Easy Apply
-            btn_text = await easy_apply_btn.inner_text()
-            if "easy apply" not in btn_text.lower():
-                console.print("[yellow]Not an Easy Apply position[/yellow]")
-                return False
-            
-            # Click Easy Apply
-            await easy_apply_btn.click()
-            await self.page.wait_for_timeout(2000)
-            
-            # Handle the application modal
-            success = await self._complete_application_modal(job)
-            
-            return success
-            
-        except Exception as e:
-            console.print(f"[red]Error applying to job: {e}[/red]")
-            return False
+            await page.wait_for_selector(self.JOB_PAGE_READY_SELECTOR, timeout=8000)
+        except PlaywrightTimeoutError:
+            pass  # Reported below as no Easy Apply button
+        
+        # Check if already applied
+        already_applied = page.locator(self.APPLIED_SELECTOR).first
+        if await already_applied.count():
+            text = await already_applied.inner_text()
+            if "applied" in text.lower():
+                if retry:
+                    console.print("[green]Application went through on the previous attempt[/green]")
+                    return ApplicationStatus.APPLIED
+                console.print("[yellow]Already applied to this job[/yellow]")
+                return ApplicationStatus.FAILED
+        
+        # Find Easy Apply button
+        easy_apply_btn = page.locator(self.EASY_APPLY_SELECTOR).first
+        
+        if not await easy_apply_btn.count():
+            console.print("[yellow]No Easy Apply button found[/yellow]")
+            return ApplicationStatus.FAILED
+        
+        # Check if it's actually Easy Apply
+        btn_text = await easy_apply_btn.inner_text()
+        if "easy apply" not in btn_text.lower():
+            console.print("[yellow]Not an Easy Apply position[/yellow]")
+            return ApplicationStatus.FAILED
+        
+        # Click Easy Apply
+        await easy_apply_btn.click()
+        
+        # Handle the application modal
+        if await self._complete_application_modal(job, page):
+            return ApplicationStatus.EASY_APPLY
+        return ApplicationStatus.FAILED
     
-    async def _complete_application_modal(self, job: Job) -> bool:
+    async def _complete_application_modal(self, job: Job, page: Page) -> bool:
         """Complete the Easy Apply application modal."""
         max_steps = 10  # Prevent infinite loops
         step = 0
         
         while step < max_steps:
             step += 1
-            await self.page.wait_for_timeout(1500)
+            try:
+                await page.wait_for_selector(self.MODAL_READY_SELECTOR, timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
             
-            # Check for success/completion
-            success_indicator = await self.page.query_selector(
-                "[class*='post-apply'], "
-                ".artdeco-modal__content h2"
-            )
-            if success_indicator:
-                text = await success_indicator.inner_text()
-                if "application sent" in text.lower() or "applied" in text.lower():
-                    console.print("[green]Application submitted successfully![/green]")
-                    return True
+            state = await self._probe_modal_state(page)
             
-            # Check for submit button
-            submit_btn = await self.page.query_selector(
-                "button[aria-label='Submit application'], "
-                "button[aria-label='Review'], "
-                ".jobs-easy-apply-content footer button.artdeco-button--primary"
-            )
+            if state["state"] == "done":
+                console.print("[green]Application submitted successfully![/green]")
+                if state["clickSelector"]:
+                    try:
+                        await page.locator(state["clickSelector"]).click()
+                    except PlaywrightTimeoutError:
+                        pass  # Submitted already; the next goto leaves the dialog behind
+                return True
             
-            if submit_btn:
-                btn_text = await submit_btn.inner_text()
-                
-                if "submit" in btn_text.lower():
-                    # Final submit
-                    await submit_btn.click()
-                    await self.page.wait_for_timeout(3000)
-                    console.print("[green]Application submitted![/green]")
-                    return True
-                    
-                elif "next" in btn_text.lower() or "continue" in btn_text.lower():
-                    # Fill current step and continue
-                    await self._fill_application_step(job)
-                    await submit_btn.click()
-                    continue
-                    
-                elif "review" in btn_text.lower():
-                    await submit_btn.click()
-                    continue
+            if state["state"] == "submit":
+                await self._click_and_wait(page, state["clickSelector"])
+                console.print("[green]Application submitted![/green]")
+                return True
             
-            # Try to find and click Next button
-            next_btn = await self.page.query_selector(
-                "button[aria-label='Continue to next step'], "
-                "button[data-easy-apply-next-button]"
-            )
-            if next_btn:
-                await self._fill_application_step(job)
-                await next_btn.click()
+            if state["state"] == "next":
+                # Fill current step and continue
+                if await self._fill_application_step(job, page, state):
+                    await page.evaluate(self.MODAL_REMEMBER_JS, self.MODAL_CONTENT_SELECTOR)
+                await self._click_and_wait(page, state["clickSelector"])
                 continue
             
-            # Check for close/dismiss button (application complete)
-            dismiss_btn = await self.page.query_selector(
-                "button[aria-label='Dismiss'], "
-                ".artdeco-modal__dismiss"
-            )
-            if dismiss_btn:
-                # Check if we completed
-                modal_content = await self.page.query_selector(".artdeco-modal__content")
-                if modal_content:
-                    content_text = await modal_content.inner_text()
-                    if "application sent" in content_text.lower():
-                        await dismiss_btn.click()
-                        return True
+            if state["state"] == "review":
+                await self._click_and_wait(page, state["clickSelector"])
+                continue
             
             # Check for errors
-            error_elem = await self.page.query_selector(
-                ".artdeco-inline-feedback--error, "
-                "[class*='error']"
-            )
-            if error_elem:
-                error_text = await error_elem.inner_text()
-                console.print(f"[red]Form error: {error_text}[/red]")
+            if state["state"] == "error":
+                console.print(f"[red]Form error: {state['errorText']}[/red]")
         
         console.print("[yellow]Could not complete application (max steps reached)[/yellow]")
         return False
     
-    async def _fill_application_step(self, job: Job):
-        """Fill in required fields for current application step."""
+    async def _probe_modal_state(self, page: Page) -> Dict:
+        """Snapshot the modal step: its state, the button to click and the fields to fill."""
+        return await page.evaluate(self.MODAL_PROBE_JS, self.MODAL_PROBE_SELECTORS)
+    
+    async def _click_and_wait(self, page: Page, selector: str, timeout: int = 5000):
+        """Click a modal button from the snapshot and wait until the modal content changes."""
+        try:
+            await page.locator(selector).click(timeout=timeout)
+            await page.wait_for_function(
+                self.MODAL_CHANGED_JS,
+                arg=self.MODAL_CONTENT_SELECTOR,
+                timeout=timeout
+            )
+        except PlaywrightTimeoutError:
+            pass  # Gone or unchanged; the next snapshot reports why
+    
+    async def _fill_application_step(self, job: Job, page: Page, state: Dict) -> bool:
+        """Fill the current application step from its snapshot; True if anything was filled."""
+        filled = False
+        
         # Handle resume upload if needed
-        resume_input = await self.page.query_selector(
-            "input[type='file'][name*='resume'], "
-            "input[accept*='.pdf']"
-        )
-        if resume_input:
-            # Select the appropriate resume
-            if self.resume_selector:
-                selected_resume = self.resume_selector.select_resume(
-                    job_title=job.title,
-                    job_description=job.description,
-                    company=job.company
-                )
-                resume_path = Path(selected_resume) if selected_resume else Path(self.settings.resume_path)
-            else:
-                resume_path = Path(self.settings.resume_path)
-            
+        if state["resume"]:
+            resume_path = Path(self._resume_for(job))
             if resume_path.exists():
-                await resume_input.set_input_files(str(resume_path))
+                await page.locator(self.RESUME_INPUT_SELECTOR).first.set_input_files(str(resume_path))
                 console.print(f"[cyan]Uploaded resume: {resume_path.name}[/cyan]")
+                filled = True
             else:
                 console.print(f"[red]Resume not found: {resume_path}[/red]")
         
         # Handle cover letter textarea
-        cover_letter_input = await self.page.query_selector(
-            "textarea[name*='cover'], "
-            "textarea[aria-label*='cover letter'], "
-            "textarea[id*='cover']"
-        )
-        if cover_letter_input and self.cover_letter_generator:
-            # Generate cover letter
-            cover_letter = await self.cover_letter_generator.generate(
-                job_title=job.title,
-                company=job.company,
-                job_description=job.description or ""
-            )
+        if state["coverLetter"] and self.cover_letter_generator:
+            cover_letter = await self._cover_letter_for(job)
             if cover_letter:
-                await cover_letter_input.fill(cover_letter)
+                await page.locator(self.COVER_LETTER_SELECTOR).first.fill(cover_letter)
                 console.print("[cyan]Generated and filled cover letter[/cyan]")
+                filled = True
         
-        # Handle phone number field
-        phone_input = await self.page.query_selector(
-            "input[name*='phone'], "
-            "input[aria-label*='phone'], "
-            "input[id*='phone']"
-        )
-        if phone_input:
-            current_value = await phone_input.input_value()
-            if not current_value:
-                # Skip if no phone configured
-                pass
-        
-        # Handle text inputs with labels
-        required_fields = await self.page.query_selector_all(
-            ".jobs-easy-apply-form-section__grouping input[required], "
-            ".jobs-easy-apply-form-section__grouping select[required]"
-        )
-        
-        for field in required_fields:
+        # Required fields left empty, then unchecked "Yes" options of fieldset questions
+        for field in state["fields"]:
             try:
-                field_type = await field.get_attribute("type")
-                current_value = await field.input_value() if field_type != "select" else None
-                
-                # Skip if already filled
-                if current_value:
+                if field["kind"] == "radio":
+                    await page.locator(field["selector"]).click()
+                    filled = True
                     continue
                 
-                # Try to find label
-                field_id = await field.get_attribute("id")
-                if field_id:
-                    label = await self.page.query_selector(f"label[for='{field_id}']")
-                    if label:
-                        label_text = await label.inner_text()
-                        # Handle common fields
-                        label_lower = label_text.lower()
-                        
-                        if "year" in label_lower and "experience" in label_lower:
-                            await field.fill("3")
-                        elif "city" in label_lower:
-                            await field.fill(self.settings.location.split(",")[0])
-                            
-            except Exception as e:
+                # Handle common fields
+                for pattern, answer in _FIELD_ANSWERS:
+                    if not pattern.search(field["hint"]):
+                        continue
+                    value = answer(self.settings)
+                    if field["kind"] == "select":
+                        # Only pick an option the snapshot listed, never wait for a missing one
+                        option = next((o for o in field["options"] if o.lower() == value.lower()), None)
+                        if option is None:
+                            break
+                        await page.locator(field["selector"]).select_option(label=option)
+                    else:
+                        await page.locator(field["selector"]).fill(value)
+                    filled = True
+                    break
+            except Exception:
                 continue
         
-        # Handle radio buttons and checkboxes (usually "yes" questions)
-        radio_groups = await self.page.query_selector_all(
-            ".jobs-easy-apply-form-section__grouping fieldset"
-        )
-        
-        for group in radio_groups:
-            try:
-                # Check if required
-                legend = await group.query_selector("legend")
-                if not legend:
-                    continue
-                
-                # Find the "Yes" option and select it
-                yes_option = await group.query_selector(
-                    "input[value='Yes'], "
-                    "input[value='yes'], "
-                    "label:has-text('Yes') input"
+        return filled
+    
+    def _prefetch_cover_letter(self, job: Job):
+        """Start generating a job's cover letter in the background."""
+        if job.id not in self._cover_letters:
+            self._cover_letters[job.id] = asyncio.create_task(self.cover_letter_generator.generate(
+                job_title=job.title,
+                company=job.company,
+                job_description=job.description or ""
+            ))
+    
+    async def _cover_letter_for(self, job: Job) -> Optional[str]:
+        """Cover letter for a job, prefetched or generated now."""
+        self._prefetch_cover_letter(job)
+        return await self._cover_letters[job.id]
+    
+    def _resume_for(self, job: Job) -> str:
+        """Path of the resume to use for a job, selected once per job."""
+        if job.id not in self._resumes:
+            selected_resume = None
+            if self.resume_selector:
+                selected_resume = self.resume_selector.select_resume(
+                    job_title=job.title,
+                    job_description=job.description,
+                    company=job.company
                 )
-                if yes_option:
-                    is_checked = await yes_option.is_checked()
-                    if not is_checked:
-                        await yes_option.click()
-            except:
-                continue
+            self._resumes[job.id] = selected_resume or self.settings.resume_path
+        return self._resumes[job.id]
+    
+    async def _attempt_application(
+        self,
+        job: Job,
+        page: Page
+    ) -> Tuple[ApplicationStatus, Optional[str]]:
+        """Apply to one job; returns the status and error message to record."""
+        self.stats["attempted"] += 1
+        
+        status = await self.apply_to_job(job, page)
+        if status != ApplicationStatus.FAILED:
+            self.stats["successful"] += 1
+            return status, None
+        
+        self.stats["failed"] += 1
+        return ApplicationStatus.FAILED, "Application could not be completed"
     
     async def apply_to_jobs(
         self,
@@ -290,6 +443,7 @@ class JobApplier:
         # Get jobs to apply to
         if jobs is None:
             jobs = self.repository.get_unapplied_easy_apply_jobs(limit=max_apps)
+        jobs = jobs[:max_apps]
         
         if not jobs:
             console.print("[yellow]No jobs to apply to.[/yellow]")
@@ -297,12 +451,41 @@ class JobApplier:
         
         console.print(f"\n[bold cyan]Starting applications ({len(jobs)} jobs)[/bold cyan]")
         
-        async with async_playwright() as playwright:
-            await self.auth.start_browser(playwright)
-            await self.auth.get_context()
-            self.page = await self.auth.ensure_logged_in()
-            
+        # Letters finished offline since the last run go into the cache first
+        if hasattr(self.cover_letter_generator, "collect_openai_batches"):
+            await self.cover_letter_generator.collect_openai_batches()
+        
+        # Optionally fill the cover letter cache up front, several jobs per LLM request
+        batch_size = self.settings.cover_letter_batch_size
+        if batch_size > 0 and hasattr(self.cover_letter_generator, "generate_batch"):
+            console.print("[cyan]Generating cover letters...[/cyan]")
+            await self.cover_letter_generator.generate_batch(
+                [(job.title, job.company, job.description or "") for job in jobs],
+                batch_size=batch_size
+            )
+        elif self.cover_letter_generator and self.settings.cover_letter_prefetch:
+            # Letters generate while the browser logs in and works through earlier jobs;
+            # the generator's per-provider limits still apply
+            for job in jobs:
+                self._prefetch_cover_letter(job)
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in jobs:
+            queue.put_nowait(job)
+        workers = max(1, min(self.settings.max_concurrent_applications, len(jobs)))
+        
+        async with browser_pool(self.pool) as pool:
+            # Each worker applies in its own context (tab and cookies) of the shared browser
+            sessions = []
             try:
+                pages = []
+                for i in range(workers):
+                    auth = self.auth if i == 0 else LinkedInAuthenticator()
+                    sessions.append((auth, await pool.acquire()))
+                    auth.use_context(sessions[-1][1])
+                    # Opened one by one, so later contexts load the session the first login saved
+                    pages.append(await auth.ensure_logged_in())
+                
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -310,55 +493,40 @@ class JobApplier:
                     TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                     console=console
                 ) as progress:
-                    task = progress.add_task(
-                        "[cyan]Applying to jobs...",
-                        total=min(len(jobs), max_apps)
-                    )
+                    task = progress.add_task("[cyan]Applying to jobs...", total=len(jobs))
+                    
+                    async def worker(page: Page):
+                        while not queue.empty():
+                            job = queue.get_nowait()
+                            await self.rate_limiter.acquire()
+                            try:
+                                status, error_message = await self._attempt_application(job, page)
+                                # Written right away, so a killed run still knows what LinkedIn received
+                                self.repository.record_applications(
+                                    [(job.id, self._resume_for(job), status, error_message)]
+                                )
+                            finally:
+                                progress.update(task, advance=1)
                     
-                    for i, job in enumerate(jobs[:max_apps]):
-                        self.stats["attempted"] += 1
-                        
-                        # Determine which resume will be used
-                        if self.resume_selector:
-                            selected_resume = self.resume_selector.select_resume(
-                                job_title=job.title,
-                                job_description=job.description,
-                                company=job.company
-                            )
-                            resume_to_use = selected_resume or self.settings.resume_path
-                        else:
-                            resume_to_use = self.settings.resume_path
-                        
-                        # Create application record
-                        application = self.repository.create_application(
-                            job_id=job.id,
-                            status=ApplicationStatus.PENDING,
-                            resume_used=resume_to_use
-                        )
-                        
-                        success = await self.apply_to_job(job)
-                        
-                        if success:
-                            self.stats["successful"] += 1
-                            self.repository.update_application_status(
-                                application.id,
-                                ApplicationStatus.EASY_APPLY
-                            )
-                        else:
-                            self.stats["failed"] += 1
-                            self.repository.update_application_status(
-                                application.id,
-                                ApplicationStatus.FAILED,
-                                error_message="Application could not be completed"
-                            )
-                        
-                        progress.update(task, advance=1)
-                        
-                        # Delay between applications
-                        await asyncio.sleep(5)
-                        
+                    results = await asyncio.gather(
+                        *(worker(page) for page in pages),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            console.print(f"[red]Application worker stopped: {result}[/red]")
+                
+                # Slide the session TTL forward after a working batch
+                if self.stats["successful"]:
+                    await self.auth.save_session()
+                
             finally:
-                await self.auth.close()
+                for auth, context in sessions:
+                    await auth.close()
+                    pool.release(context)
+                for letter in self._cover_letters.values():
+                    letter.cancel()  # Jobs the run never reached
+                self._cover_letters.clear()
         
         # Print summary
         console.print("\n[bold green]Application Summary:[/bold green]")
@@ -374,4 +542,16 @@ class JobApplier:
             console.print("[yellow]Auto-apply is disabled in settings.[/yellow]")
             return self.stats
         
-        return await self.apply_to_jobs(max_applications=max_applications)
+        # Connect to the LLM providers while the browser opens the first job
+        prewarm = None
+        if hasattr(self.cover_letter_generator, "prewarm"):
+            prewarm = asyncio.create_task(self.cover_letter_generator.prewarm())
+        
+        try:
+            return await self.apply_to_jobs(max_applications=max_applications)
+        finally:
+            if prewarm:
+                prewarm.cancel()
+                await asyncio.gather(prewarm, return_exceptions=True)
+            if self.cover_letter_generator:
+                await self.cover_letter_generator.aclose()
@@ -1,31 +1,190 @@
 """LinkedIn job scraper using Playwright."""
 import re
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote_plus, urlencode
-from playwright.async_api import Page, async_playwright
+import orjson
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..config import get_settings, ExperienceLevel, DatePosted
 from ..database import JobRepository
 from .authenticator import LinkedInAuthenticator
+from .browser import BrowserPool, browser_pool
+
+try:
+    from curl_cffi.requests import AsyncSession
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # HTTP fast path is optional, the browser path covers everything
+    AsyncSession = None
+    LexborHTMLParser = None
 
 console = Console()
 
+_RELATIVE_DATE_RE = re.compile(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago")
+_RELATIVE_DATE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+
+
+def _parse_posted_at(text: str, timestamp: Optional[str] = None) -> Optional[datetime]:
+    """When a job was posted, from a <time datetime> value or text like "3 days ago"."""
+    if timestamp:
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+    
+    match = _RELATIVE_DATE_RE.search(text.lower())
+    if not match:
+        return None
+    return datetime.utcnow() - int(match.group(1)) * _RELATIVE_DATE_UNITS[match.group(2)]
+
 
 class LinkedInScraper:
     """Scrapes job listings from LinkedIn."""
     
     JOBS_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+    # Static-markup endpoint behind the public job search list
+    JOBS_GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    
+    # Responses that mean we are being throttled or challenged over plain HTTP
+    BLOCKED_STATUS_CODES = {403, 429, 999}
+    CHALLENGE_MARKERS = ("challenge-platform", "cf-chl", "/checkpoint/", "authwall")
+    
+    # Job cards across LinkedIn's search layouts, most specific first
+    JOB_CARD_SELECTORS = [
+        ".jobs-search-results__list-item",
+        ".job-card-container",
+        "li[data-occludable-job-id]",
+        ".scaffold-layout__list-container li",
+        "ul.jobs-search-results__list > li"
+    ]
+    JOB_DESCRIPTION_SELECTOR = ".jobs-description__content, .jobs-box__html-content"
+    
+    # Scrollable job list containers, most specific first; the page scrolls if none is found
+    JOB_LIST_SELECTORS = [
+        ".jobs-search-results-list",
+        ".scaffold-layout__list-container",
+        "ul.jobs-search-results__list",
+        "main[role='main']"
+    ]
+    # Scrolls the list down until its bottom, after each scroll waiting until the list
+    # has had no DOM changes for quietMs (capped at capMs) instead of a fixed pause
+    SCROLL_LIST_JS = """async (args) => {
+        const container = args.containers.map((selector) => document.querySelector(selector)).find(Boolean);
+        const scroller = container || document.scrollingElement;
+        const settle = () => new Promise((resolve) => {
+            let quiet = null;
+            let cap = null;
+            const observer = new MutationObserver(() => {
+                clearTimeout(quiet);
+                quiet = setTimeout(done, args.quietMs);
+            });
+            const done = () => {
+                observer.disconnect();
+                clearTimeout(quiet);
+                clearTimeout(cap);
+                resolve();
+            };
+            observer.observe(container || document.body, {childList: true, subtree: true});
+            quiet = setTimeout(done, args.quietMs);
+            cap = setTimeout(done, args.capMs);
+        });
+        for (let i = 0; i < args.maxScrolls; i++) {
+            scroller.scrollTop += 1000;
+            await settle();
+            if (scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 100) break;
+        }
+    }"""
+    
+    # Texts read from a job's detail page
+    DETAILS_SELECTORS = {
+        "description": ".jobs-description__content, .jobs-box__html-content, [class*='description']",
+        "insights": (
+            ".jobs-unified-top-card__job-insight, "
+            ".job-details-jobs-unified-top-card__job-insight"
+        ),
+        "applicants": ".jobs-unified-top-card__applicant-count, [class*='applicant']"
+    }
+    DETAILS_EXTRACT_JS = """(selectors) => {
+        const text = (selector) => {
+            const element = document.querySelector(selector);
+            return element ? element.innerText : null;
+        };
+        return {
+            description: text(selectors.description),
+            insights: [...document.querySelectorAll(selectors.insights)].map((item) => item.innerText),
+            applicants: text(selectors.applicants)
+        };
+    }"""
     
-    def __init__(self):
-        """Initialize the scraper."""
+    # Fields read from a job card, each the first match of its selector
+    CARD_FIELD_SELECTORS = {
+        "title": (
+            ".job-card-list__title, .job-card-container__link, "
+            "a[data-control-name='job_card_title']"
+        ),
+        "company": (
+            ".job-card-container__company-name, "
+            ".job-card-container__primary-description, "
+            ".artdeco-entity-lockup__subtitle"
+        ),
+        "location": ".job-card-container__metadata-item, .artdeco-entity-lockup__caption",
+        "posted": ".job-card-container__footer-item, time",
+        "easyApply": (
+            ".job-card-container__apply-method, "
+            "[class*='easy-apply'], "
+            ".jobs-apply-button--top-card"
+        )
+    }
+    CARD_EXTRACT_JS = """(card, selectors) => {
+        const text = (selector) => {
+            const element = card.querySelector(selector);
+            return element ? element.innerText.trim() : "";
+        };
+        let jobId = card.getAttribute("data-job-id");
+        if (!jobId) {
+            const link = card.querySelector("a[href*='/jobs/view/']");
+            const match = link ? /\\/jobs\\/view\\/(\\d+)/.exec(link.getAttribute("href") || "") : null;
+            jobId = match ? match[1] : null;
+        }
+        const time = card.querySelector("time[datetime]");
+        return {
+            jobId: jobId,
+            title: text(selectors.title),
+            company: text(selectors.company),
+            location: text(selectors.location),
+            posted: text(selectors.posted),
+            postedAt: time ? time.getAttribute("datetime") : null,
+            isEasyApply: card.querySelector(selectors.easyApply) !== null ||
+                card.innerText.toLowerCase().includes("easy apply")
+        };
+    }"""
+    # Every card's fields in one call, from the first layout with cards on the page
+    # (layouts nest some of the selectors, so matches are not combined)
+    PAGE_CARDS_JS = f"""(args) => {{
+        const read = {CARD_EXTRACT_JS};
+        const layout = args.layouts.find((selector) => document.querySelector(selector));
+        return layout ? [...document.querySelectorAll(layout)].map((card) => read(card, args.fields)) : [];
+    }}"""
+    
+    def __init__(self, pool: Optional[BrowserPool] = None):
+        """Initialize the scraper, optionally inside a shared browser pool."""
         self.settings = get_settings()
+        self.pool = pool
         self.auth = LinkedInAuthenticator()
         self.repository = JobRepository()
         self.page: Optional[Page] = None
+        self._http = None
     
     def build_search_url(
         self,
@@ -34,14 +193,16 @@ class LinkedInScraper:
         experience_levels: Optional[List[ExperienceLevel]] = None,
         date_posted: Optional[DatePosted] = None,
         easy_apply_only: bool = False,
-        page: int = 0
+        page: int = 0,
+        start: Optional[int] = None,
+        base_url: Optional[str] = None
     ) -> str:
         """Build LinkedIn job search URL with filters."""
         params = {
             "keywords": keywords,
             "location": location or self.settings.location,
             "sortBy": "DD",  # Sort by date
-            "start": page * 25,  # 25 jobs per page
+            "start": page * 25 if start is None else start,  # 25 jobs per page
         }
         
         # Add experience level filter
@@ -57,276 +218,352 @@ class LinkedInScraper:
         if easy_apply_only:
             params["f_AL"] = "true"
         
-        return f"{self.JOBS_SEARCH_URL}?{urlencode(params)}"
+        return f"{base_url or self.JOBS_SEARCH_URL}?{urlencode(params)}"
     
-    async def search_jobs(
+    def _load_session_cookies(self) -> Dict[str, str]:
+        """Load LinkedIn cookies from the saved browser session."""
+        storage_path = Path(self.auth.STORAGE_STATE_PATH)
+        if not storage_path.exists():
+            return {}
+        
+        try:
+            data = orjson.loads(storage_path.read_bytes())
+        except Exception as e:
+            console.print(f"[yellow]Could not read session cookies: {e}[/yellow]")
+            return {}
+        
+        return {
+            cookie["name"]: cookie["value"]
+            for cookie in data.get("cookies", [])
+            if "linkedin.com" in cookie.get("domain", "")
+        }
+    
+    async def _fetch_list_page(
         self,
         keywords: str,
-        max_pages: int = 3,
+        start: int,
+        easy_apply_only: bool = False
+    ) -> Optional[List[Dict]]:
+        """Fetch one job list page over HTTP. Returns None when blocked."""
+        url = self.build_search_url(
+            keywords=keywords,
+            experience_levels=self.settings.experience_levels_list,
+            date_posted=self.settings.date_posted_filter,
+            easy_apply_only=easy_apply_only,
+            start=start,
+            base_url=self.JOBS_GUEST_SEARCH_URL
+        )
+        console.print(f"[dim]Fetching: {url}[/dim]")
+        
+        response = await self._http.get(url, timeout=20)
+        if response.status_code in self.BLOCKED_STATUS_CODES:
+            console.print(f"[yellow]HTTP {response.status_code} from LinkedIn[/yellow]")
+            return None
+        
+        html = response.text
+        if any(marker in response.url or marker in html for marker in self.CHALLENGE_MARKERS):
+            console.print("[yellow]Security challenge detected on job list[/yellow]")
+            return None
+        
+        if response.status_code >= 400:
+            # Past the last page LinkedIn answers with a 400
+            return []
+        
+        return self._parse_list_page(html, keywords, easy_apply_only)
+    
+    def _parse_list_page(
+        self,
+        html: str,
+        search_keyword: str,
         easy_apply_only: bool = False
     ) -> List[Dict]:
-        """Search for jobs with given keywords."""
+        """Parse job cards out of a static job list page."""
+        jobs = []
+        tree = LexborHTMLParser(html)
+        
+        for card in tree.css("div.base-card"):
+            urn = card.attributes.get("data-entity-urn") or ""
+            job_id = urn.rsplit(":", 1)[-1]
+            if not job_id.isdigit():
+                continue
+            
+            def text(selector: str) -> str:
+                node = card.css_first(selector)
+                return node.text(strip=True) if node else ""
+            
+            time_node = card.css_first("time")
+            jobs.append({
+                "linkedin_job_id": job_id,
+                "title": text(".base-search-card__title") or "Unknown",
+                "company": text(".base-search-card__subtitle") or "Unknown",
+                "location": text(".job-search-card__location"),
+                "job_url": f"https://www.linkedin.com/jobs/view/{job_id}/",
+                "posted_date": text("time"),
+                "posted_at": _parse_posted_at(
+                    text("time"), time_node.attributes.get("datetime") if time_node else None
+                ),
+                "is_easy_apply": easy_apply_only or "easy apply" in card.text().lower(),
+                "search_keyword": search_keyword,
+                "scraped_at": datetime.utcnow()
+            })
+        
+        return jobs
+    
+    async def search_jobs_fast(
+        self,
+        keywords: str,
+        max_pages: int = 3,
+        easy_apply_only: bool = False
+    ) -> Optional[List[Dict]]:
+        """Search for jobs over plain HTTP. Returns None when blocked."""
         all_jobs = []
+        start = 0
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task(
-                f"[cyan]Searching jobs for '{keywords}'...",
-                total=max_pages
-            )
+        # Guest pages are smaller than browser pages, so page by result offset
+        while start < max_pages * 25:
+            jobs = await self._fetch_list_page(keywords, start, easy_apply_only)
+            if jobs is None:
+                return None
+            if not jobs:
+                break
             
-            for page_num in range(max_pages):
-                search_url = self.build_search_url(
-                    keywords=keywords,
-                    experience_levels=self.settings.experience_levels_list,
-                    date_posted=self.settings.date_posted_filter,
-                    easy_apply_only=easy_apply_only,
-                    page=page_num
-                )
-                
-                console.print(f"[dim]Page {page_num + 1}: {search_url}[/dim]")
-                
-                jobs = await self._scrape_job_listings(search_url, keywords)
-                all_jobs.extend(jobs)
+            all_jobs.extend(jobs)
+            start += len(jobs)
+            
+            # Small delay between pages
+            await asyncio.sleep(1)
+        
+        return all_jobs
+    
+    async def _run_fast(
+        self,
+        keywords: List[str],
+        max_pages_per_keyword: int,
+        easy_apply_only: bool,
+        concurrency: int = 3
+    ) -> Dict[str, List[Dict]]:
+        """Scrape job lists over HTTP, stopping at the first block."""
+        results = {}
+        
+        if AsyncSession is None:
+            console.print("[yellow]curl_cffi/selectolax not installed, using browser.[/yellow]")
+            return results
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        blocked = asyncio.Event()
+        
+        async def fetch_keyword(keyword: str):
+            async with semaphore:
+                # Blocked requests rarely recover within a run
+                if blocked.is_set():
+                    return
                 
-                progress.update(task, advance=1)
+                console.print(f"\n[bold cyan]Fetching: '{keyword}'[/bold cyan]")
+                try:
+                    jobs = await self.search_jobs_fast(
+                        keywords=keyword,
+                        max_pages=max_pages_per_keyword,
+                        easy_apply_only=easy_apply_only
+                    )
+                except Exception as e:
+                    console.print(f"[yellow]HTTP fetch failed: {e}[/yellow]")
+                    jobs = None
                 
-                # Small delay between pages
-                await asyncio.sleep(2)
+                if jobs is None:
+                    if not blocked.is_set():
+                        console.print("[yellow]Falling back to the browser for remaining keywords.[/yellow]")
+                    blocked.set()
+                    return
                 
-                # If we got less than 25 jobs, we've reached the end
-                if len(jobs) < 20:
-                    break
+                results[keyword] = jobs
         
-        return all_jobs
+        async with AsyncSession(
+            impersonate="chrome124",
+            cookies=self._load_session_cookies()
+        ) as self._http:
+            await asyncio.gather(*(fetch_keyword(keyword) for keyword in keywords))
+        
+        # Keep the caller's keyword order
+        return {keyword: results[keyword] for keyword in keywords if keyword in results}
     
-    async def _scrape_job_listings(self, url: str, search_keyword: str) -> List[Dict]:
-        """Scrape job listings from a search results page."""
-        jobs = []
+    def _progress(self) -> Progress:
+        """Create the progress display used for keyword searches."""
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        )
+    
+    async def search_jobs(
+        self,
+        keywords: str,
+        max_pages: int = 3,
+        easy_apply_only: bool = False,
+        page: Optional[Page] = None,
+        progress: Optional[Progress] = None
+    ) -> List[Dict]:
+        """Search for jobs not stored yet with given keywords, on the given tab if any."""
+        if progress is None:
+            # Only one live display may run at a time, so concurrent searches share one
+            with self._progress() as progress:
+                return await self.search_jobs(keywords, max_pages, easy_apply_only, page, progress)
         
-        try:
-            await self.page.goto(url, wait_until="networkidle", timeout=60000)
-            await self.page.wait_for_timeout(5000)  # Increased wait time
-            
-            # Wait for job cards to load - try multiple selectors
-            selectors = [
-                ".jobs-search-results__list-item",
-                ".job-card-container",
-                "li[data-occludable-job-id]",
-                ".scaffold-layout__list-container li",
-                "ul.jobs-search-results__list > li"
-            ]
-            
-            job_cards_loaded = False
-            for selector in selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=10000)
-                    job_cards_loaded = True
-                    break
-                except:
-                    continue
-            
-            if not job_cards_loaded:
-                console.print("[yellow]No job listings found on this page.[/yellow]")
-                return jobs
-            
-            # Scroll more aggressively to load all jobs
-            await self._scroll_job_list()
+        all_jobs = []
+        
+        task = progress.add_task(
+            f"[cyan]Searching jobs for '{keywords}'...",
+            total=max_pages
+        )
+        
+        for page_num in range(max_pages):
+            search_url = self.build_search_url(
+                keywords=keywords,
+                experience_levels=self.settings.experience_levels_list,
+                date_posted=self.settings.date_posted_filter,
+                easy_apply_only=easy_apply_only,
+                page=page_num
+            )
             
-            # Wait a bit more for dynamic content
-            await self.page.wait_for_timeout(2000)
+            console.print(f"[dim]Page {page_num + 1}: {search_url}[/dim]")
             
-            # Try multiple selectors to get all job cards
-            job_cards = []
-            for selector in selectors:
-                cards = await self.page.query_selector_all(selector)
-                if cards:
-                    job_cards = cards
-                    break
+            jobs, card_count, new_count = await self._scrape_job_listings(search_url, keywords, page)
+            all_jobs.extend(jobs)
             
-            # Remove duplicates by job ID
-            seen_ids = set()
-            unique_cards = []
-            for card in job_cards:
-                try:
-                    job_id = await card.get_attribute("data-job-id")
-                    if not job_id:
-                        # Try to extract from link
-                        link = await card.query_selector("a[href*='/jobs/view/']")
-                        if link:
-                            href = await link.get_attribute("href")
-                            match = re.search(r"/jobs/view/(\d+)", href or "")
-                            if match:
-                                job_id = match.group(1)
-                    
-                    if job_id and job_id not in seen_ids:
-                        seen_ids.add(job_id)
-                        unique_cards.append(card)
-                except:
-                    unique_cards.append(card)  # Include if we can't get ID
+            progress.update(task, advance=1)
             
-            console.print(f"[cyan]Found {len(unique_cards)} unique job cards[/cyan]")
-            
-            for card in unique_cards:
-                try:
-                    job_data = await self._extract_job_from_card(card, search_keyword)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    console.print(f"[dim red]Error extracting job: {e}[/dim red]")
-                    continue
+            # If the page listed less than 25 jobs, we've reached the end
+            if card_count < 20:
+                break
             
-        except Exception as e:
-            console.print(f"[red]Error scraping job listings: {e}[/red]")
-        
-        return jobs
-    
-    async def _scroll_job_list(self):
-        """Scroll the job list to load more results."""
-        # Try multiple selectors for the job list container
-        selectors = [
-            ".jobs-search-results-list",
-            ".scaffold-layout__list-container",
-            "ul.jobs-search-results__list",
-            "main[role='main']"
-        ]
-        
-        job_list = None
-        for selector in selectors:
-            job_list = await self.page.query_selector(selector)
-            if job_list:
+            # Results are newest first, so past a page of known jobs the rest were seen
+            # on earlier runs; the first page may still lead with reposted jobs
+            if page_num > 0 and new_count == 0:
+                console.print(f"[dim]Page {page_num + 1} had only saved jobs, stopping '{keywords}'[/dim]")
                 break
+            
+            # Small delay between pages
+            await asyncio.sleep(2)
         
-        if job_list:
-            # Scroll more times to ensure all jobs load
-            for i in range(10):
-                await job_list.evaluate("el => el.scrollTop += 1000")
-                await self.page.wait_for_timeout(800)
-                # Check if we've reached the bottom
-                scroll_height = await job_list.evaluate("el => el.scrollHeight")
-                scroll_top = await job_list.evaluate("el => el.scrollTop")
-                client_height = await job_list.evaluate("el => el.clientHeight")
-                if scroll_top + client_height >= scroll_height - 100:
-                    break
-        else:
-            # Fallback: scroll the page itself
-            for _ in range(5):
-                await self.page.evaluate("window.scrollBy(0, 1000)")
-                await self.page.wait_for_timeout(800)
+        return all_jobs
     
-    async def _extract_job_from_card(
+    async def _scrape_job_listings(
         self,
-        card,
-        search_keyword: str
-    ) -> Optional[Dict]:
-        """Extract job data from a job card element."""
+        url: str,
+        search_keyword: str,
+        page: Optional[Page] = None
+    ) -> Tuple[List[Dict], int, int]:
+        """Scrape the jobs not stored yet from a search results page.
+        
+        Returns them with the number of unique cards the page listed and how many were new.
+        """
+        jobs = []
+        card_count = 0
+        new_count = 0
+        page = page or self.page
+        
         try:
-            # Get job ID from data attribute or link
-            job_id = await card.get_attribute("data-job-id")
-            if not job_id:
-                # Try to extract from link
-                link = await card.query_selector("a[href*='/jobs/view/']")
-                if link:
-                    href = await link.get_attribute("href")
-                    match = re.search(r"/jobs/view/(\d+)", href)
-                    if match:
-                        job_id = match.group(1)
+            await page.goto(url, wait_until="domcontentloaded")
             
-            if not job_id:
-                return None
-            
-            # Extract title
-            title_elem = await card.query_selector(
-                ".job-card-list__title, .job-card-container__link, "
-                "a[data-control-name='job_card_title']"
-            )
-            title = await title_elem.inner_text() if title_elem else "Unknown"
-            title = title.strip()
-            
-            # Extract company
-            company_elem = await card.query_selector(
-                ".job-card-container__company-name, "
-                ".job-card-container__primary-description, "
-                ".artdeco-entity-lockup__subtitle"
-            )
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-            company = company.strip()
+            # Returns as soon as the first card of any layout renders
+            selectors = self.JOB_CARD_SELECTORS
+            try:
+                await page.wait_for_selector(", ".join(selectors), timeout=10000)
+            except PlaywrightTimeoutError:
+                console.print("[yellow]No job listings found on this page.[/yellow]")
+                return jobs, card_count, new_count
             
-            # Extract location
-            location_elem = await card.query_selector(
-                ".job-card-container__metadata-item, "
-                ".artdeco-entity-lockup__caption"
-            )
-            location = await location_elem.inner_text() if location_elem else ""
-            location = location.strip()
+            # Scroll to load all jobs; returns once the list stops changing
+            await self._scroll_job_list(page)
             
-            # Check for Easy Apply badge
-            easy_apply_badge = await card.query_selector(
-                ".job-card-container__apply-method, "
-                "[class*='easy-apply'], "
-                ".jobs-apply-button--top-card"
+            # All cards in one round trip to the browser
+            records = await page.evaluate(
+                self.PAGE_CARDS_JS,
+                {"layouts": selectors, "fields": self.CARD_FIELD_SELECTORS}
             )
-            is_easy_apply = easy_apply_badge is not None
             
-            # If badge not found, check text content
-            if not is_easy_apply:
-                card_text = await card.inner_text()
-                is_easy_apply = "Easy Apply" in card_text or "easy apply" in card_text.lower()
+            # Remove duplicates by job ID
+            unique_records = {}
+            for fields in records:
+                if fields["jobId"]:
+                    unique_records.setdefault(fields["jobId"], fields)
             
-            # Extract posted date
-            posted_elem = await card.query_selector(
-                ".job-card-container__footer-item, time"
+            # Jobs saved on an earlier page or run are skipped
+            card_count = len(unique_records)
+            existing = self.repository.existing_ids(unique_records)
+            jobs = [
+                self._job_from_card(fields, search_keyword)
+                for job_id, fields in unique_records.items() if job_id not in existing
+            ]
+            new_count = len(jobs)
+            console.print(
+                f"[cyan]Found {card_count} unique job cards "
+                f"({card_count - new_count} already saved)[/cyan]"
             )
-            posted_date = await posted_elem.inner_text() if posted_elem else ""
-            posted_date = posted_date.strip()
-            
-            # Build job URL
-            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-            
-            return {
-                "linkedin_job_id": job_id,
-                "title": title,
-                "company": company,
-                "location": location,
-                "job_url": job_url,
-                "posted_date": posted_date,
-                "is_easy_apply": is_easy_apply,
-                "search_keyword": search_keyword,
-                "scraped_at": datetime.utcnow()
-            }
             
         except Exception as e:
-            console.print(f"[dim red]Error parsing card: {e}[/dim red]")
-            return None
+            console.print(f"[red]Error scraping job listings: {e}[/red]")
+        
+        return jobs, card_count, new_count
     
-    async def get_job_details(self, job_url: str) -> Dict:
+    async def _scroll_job_list(self, page: Optional[Page] = None):
+        """Scroll the job list to load more results."""
+        page = page or self.page
+        await page.evaluate(self.SCROLL_LIST_JS, {
+            "containers": self.JOB_LIST_SELECTORS,
+            "quietMs": 300,
+            "capMs": 3000,
+            "maxScrolls": 10
+        })
+    
+    def _job_from_card(self, fields: Dict, search_keyword: str) -> Dict:
+        """Build the job record from the fields read off a job card."""
+        job_id = fields["jobId"]
+        title = fields["title"] or "Unknown"
+        company = fields["company"] or "Unknown"
+        location = fields["location"]
+        is_easy_apply = fields["isEasyApply"]
+        posted_date = fields["posted"]
+        posted_at = _parse_posted_at(posted_date, fields["postedAt"])
+        
+        # Build job URL
+        job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+        
+        return {
+            "linkedin_job_id": job_id,
+            "title": title,
+            "company": company,
+            "location": location,
+            "job_url": job_url,
+            "posted_date": posted_date,
+            "posted_at": posted_at,
+            "is_easy_apply": is_easy_apply,
+            "search_keyword": search_keyword,
+            "scraped_at": datetime.utcnow()
+        }
+    
+    async def get_job_details(self, job_url: str, page: Optional[Page] = None) -> Dict:
         """Get detailed information about a specific job."""
         details = {}
+        page = page or self.page
         
         try:
-            await self.page.goto(job_url, wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(3000)
+            await page.goto(job_url, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(self.JOB_DESCRIPTION_SELECTOR, state="visible", timeout=10000)
+            except PlaywrightTimeoutError:
+                # Unknown layout; let it settle before the broader selectors below
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
             
-            # Get job description
-            desc_elem = await self.page.query_selector(
-                ".jobs-description__content, "
-                ".jobs-box__html-content, "
-                "[class*='description']"
-            )
-            if desc_elem:
-                details["description"] = await desc_elem.inner_text()
+            # Description, side panel insights and applicant count in one round trip
+            texts = await page.evaluate(self.DETAILS_EXTRACT_JS, self.DETAILS_SELECTORS)
+            if texts["description"] is not None:
+                details["description"] = texts["description"]
             
             # Get additional details from the side panel
-            detail_items = await self.page.query_selector_all(
-                ".jobs-unified-top-card__job-insight, "
-                ".job-details-jobs-unified-top-card__job-insight"
-            )
-            
-            for item in detail_items:
-                text = await item.inner_text()
+            for text in texts["insights"]:
                 text_lower = text.lower()
                 
                 if "experience" in text_lower or "level" in text_lower:
@@ -337,107 +574,197 @@ class LinkedInScraper:
                     details["salary_range"] = text.strip()
             
             # Get applicant count
-            applicant_elem = await self.page.query_selector(
-                ".jobs-unified-top-card__applicant-count, "
-                "[class*='applicant']"
-            )
-            if applicant_elem:
-                details["applicant_count"] = await applicant_elem.inner_text()
+            if texts["applicants"] is not None:
+                details["applicant_count"] = texts["applicants"]
             
         except Exception as e:
             console.print(f"[red]Error getting job details: {e}[/red]")
         
         return details
     
+    def _queue_keyword_jobs(
+        self,
+        keyword: str,
+        jobs: List[Dict],
+        pending: Dict[str, Dict],
+        check_database: bool = True
+    ) -> List[Dict]:
+        """Queue the new jobs found for a keyword for the end-of-run save and report them."""
+        # Browser results were already filtered against the database page by page
+        stored = set()
+        if check_database:
+            stored = self.repository.existing_ids({job["linkedin_job_id"] for job in jobs} - pending.keys())
+        
+        added = []
+        for job in jobs:
+            job_id = job["linkedin_job_id"]
+            if job_id not in stored and job_id not in pending:
+                pending[job_id] = job
+                added.append(job)
+        
+        console.print(
+            f"[green]Keyword '{keyword}': Found {len(jobs)} jobs, "
+            f"{len(added)} new jobs to add to database[/green]"
+        )
+        
+        if len(jobs) == 0:
+            console.print(f"[yellow]Warning: No jobs found for '{keyword}'. "
+                        f"Try adjusting search parameters.[/yellow]")
+        
+        return added
+    
     async def run(
         self,
         keywords: Optional[List[str]] = None,
         max_pages_per_keyword: int = 3,
         get_details: bool = False,
-        easy_apply_only: bool = False
+        easy_apply_only: bool = False,
+        fast: bool = True,
+        concurrency: int = 3
     ) -> List[Dict]:
-        """Run the scraper for multiple keywords."""
+        """Run the scraper for multiple keywords, up to `concurrency` at a time."""
         keywords = keywords or self.settings.keywords_list
         all_jobs = []
         
         total_found = 0
-        total_added = 0
+        # New jobs of every keyword, saved in one transaction when the run ends
+        pending: Dict[str, Dict] = {}
+        
+        # Job lists over plain HTTP first; the browser only covers what that can't
+        fast_results = {}
+        if fast:
+            fast_results = await self._run_fast(
+                keywords, max_pages_per_keyword, easy_apply_only, concurrency
+            )
+        
+        detail_jobs = []
+        for keyword, jobs in fast_results.items():
+            added = self._queue_keyword_jobs(keyword, jobs, pending)
+            total_found += len(jobs)
+            all_jobs.extend(jobs)
+            if get_details:
+                detail_jobs.extend(added[:5])  # Limit to first 5 to avoid rate limiting
+        
+        browser_keywords = [k for k in keywords if k not in fast_results]
         
         max_retries = 2
         retry_count = 0
         
-        while retry_count <= max_retries:
-            try:
-                async with async_playwright() as playwright:
-                    # Start browser and authenticate
-                    await self.auth.start_browser(playwright)
-                    await self.auth.get_context()
-                    
-                    try:
-                        self.page = await self.auth.ensure_logged_in()
-                    except RuntimeError as e:
-                        if "Failed to log in" in str(e) and retry_count < max_retries:
-                            console.print(f"[yellow]Login failed (attempt {retry_count + 1}/{max_retries + 1}). Retrying...[/yellow]")
-                            retry_count += 1
-                            await self.auth.close()
-                            await asyncio.sleep(5)
-                            continue
-                        else:
-                            raise
-                    
-                    try:
-                        for keyword in keywords:
-                            console.print(f"\n[bold cyan]Searching for: '{keyword}'[/bold cyan]")
-                            console.print(f"[dim]Pages: {max_pages_per_keyword}, Easy Apply Only: {easy_apply_only}[/dim]")
-                            
-                            jobs = await self.search_jobs(
-                                keywords=keyword,
-                                max_pages=max_pages_per_keyword,
-                                easy_apply_only=easy_apply_only
-                            )
-                            
-                            # Save to database
-                            added = self.repository.add_jobs_batch(jobs)
-                            total_found += len(jobs)
-                            total_added += len(added)
-                            
-                            console.print(
-                                f"[green]Keyword '{keyword}': Found {len(jobs)} jobs, "
-                                f"{len(added)} new jobs added to database[/green]"
-                            )
+        try:
+            while (browser_keywords or detail_jobs) and retry_count <= max_retries:
+                try:
+                    async with browser_pool(self.pool) as pool, pool.context() as context:
+                        # Authenticate inside the shared (or a private) browser
+                        self.auth.use_context(context)
+                        
+                        try:
+                            self.page = await self.auth.ensure_logged_in()
+                        except RuntimeError as e:
+                            if "Failed to log in" in str(e) and retry_count < max_retries:
+                                console.print(f"[yellow]Login failed (attempt {retry_count + 1}/{max_retries + 1}). Retrying...[/yellow]")
+                                retry_count += 1
+                                await self.auth.close()
+                                await asyncio.sleep(5)
+                                continue
+                            else:
+                                raise
+                        
+                        semaphore = asyncio.Semaphore(concurrency)
+                        
+                        async def scrape_keyword(keyword: str, progress: Progress):
+                            async with semaphore:
+                                # Each keyword searches in its own context of the shared browser,
+                                # loaded with the session the login above saved
+                                keyword_context = await pool.acquire()
+                                try:
+                                    page = await keyword_context.new_page()
+                                except Exception:
+                                    pool.release(keyword_context)
+                                    raise
+                                try:
+                                    console.print(f"\n[bold cyan]Searching for: '{keyword}'[/bold cyan]")
+                                    console.print(f"[dim]Pages: {max_pages_per_keyword}, Easy Apply Only: {easy_apply_only}[/dim]")
+                                    
+                                    jobs = await self.search_jobs(
+                                        keywords=keyword,
+                                        max_pages=max_pages_per_keyword,
+                                        easy_apply_only=easy_apply_only,
+                                        page=page,
+                                        progress=progress
+                                    )
+                                    
+                                    # Queue for the end-of-run save
+                                    added = self._queue_keyword_jobs(
+                                        keyword, jobs, pending, check_database=False
+                                    )
+                                    
+                                    # Optionally get detailed info for new jobs
+                                    if get_details and added:
+                                        console.print("[cyan]Getting job details...[/cyan]")
+                                        for job in added[:5]:  # Limit to first 5 to avoid rate limiting
+                                            details = await self.get_job_details(job["job_url"], page)
+                                            # Update job with details (would need repo method)
+                                            await asyncio.sleep(1)
+                                    
+                                finally:
+                                    await page.close()
+                                    pool.release(keyword_context)
+                                
+                                # Delay between keywords on this slot
+                                await asyncio.sleep(3)
+                                return jobs, added
+                        
+                        try:
+                            with self._progress() as progress:
+                                results = await asyncio.gather(
+                                    *(scrape_keyword(keyword, progress) for keyword in browser_keywords),
+                                    return_exceptions=True
+                                )
                             
-                            if len(jobs) == 0:
-                                console.print(f"[yellow]Warning: No jobs found for '{keyword}'. "
-                                            f"Try adjusting search parameters.[/yellow]")
+                            # Finished keywords are not searched again on retry
+                            failed = []
+                            for keyword, result in zip(browser_keywords, results):
+                                if isinstance(result, Exception):
+                                    console.print(f"[red]Error searching '{keyword}': {result}[/red]")
+                                    failed.append(keyword)
+                                    continue
+                                jobs, added = result
+                                total_found += len(jobs)
+                                all_jobs.extend(jobs)
+                            browser_keywords = failed
                             
-                            # Optionally get detailed info for new jobs
-                            if get_details and added:
+                            # Details for jobs found over HTTP need the browser too
+                            if detail_jobs:
                                 console.print("[cyan]Getting job details...[/cyan]")
-                                for job in added[:5]:  # Limit to first 5 to avoid rate limiting
-                                    details = await self.get_job_details(job.job_url)
-                                    # Update job with details (would need repo method)
+                                for job in detail_jobs:
+                                    details = await self.get_job_details(job["job_url"])
                                     await asyncio.sleep(1)
+                                detail_jobs = []
                             
-                            all_jobs.extend(jobs)
+                            if browser_keywords:
+                                raise RuntimeError(
+                                    f"Search failed for: {', '.join(browser_keywords)}"
+                                )
                             
-                            # Delay between keywords
-                            await asyncio.sleep(3)
-                        
-                        # If we got here, success - break the retry loop
-                        break
-                        
-                    finally:
-                        await self.auth.close()
-                        
-            except Exception as e:
-                if retry_count < max_retries:
-                    console.print(f"[yellow]Error during scraping (attempt {retry_count + 1}/{max_retries + 1}): {e}[/yellow]")
-                    console.print("[yellow]Retrying in 10 seconds...[/yellow]")
-                    retry_count += 1
-                    await asyncio.sleep(10)
-                else:
-                    console.print(f"[red]Failed after {max_retries + 1} attempts: {e}[/red]")
-                    raise
+                            # If we got here, success - break the retry loop
+                            break
+                            
+                        finally:
+                            await self.auth.close()
+                            
+                except Exception as e:
+                    if retry_count < max_retries:
+                        console.print(f"[yellow]Error during scraping (attempt {retry_count + 1}/{max_retries + 1}): {e}[/yellow]")
+                        console.print("[yellow]Retrying in 10 seconds...[/yellow]")
+                        retry_count += 1
+                        await asyncio.sleep(10)
+                    else:
+                        console.print(f"[red]Failed after {max_retries + 1} attempts: {e}[/red]")
+                        raise
+            
+        finally:
+            # Whatever was found is kept, even when the browser part gave up
+            total_added = len(self.repository.add_jobs_batch(list(pending.values())))
         
         # Print summary
         stats = self.repository.get_application_stats()
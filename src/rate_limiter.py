@@ -0,0 +1,37 @@
+"""Async rate limiting for calls to external services."""
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncTokenBucket:
+    """Token bucket for coroutines: refills `rate` tokens per second, up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, capacity: Optional[float] = None) -> "AsyncTokenBucket":
+        """Create a bucket from a requests-per-minute limit."""
+        return cls(requests_per_minute / 60.0, capacity)
+
+    def _refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` are available, then take them."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
@@ -1,11 +1,22 @@
 """Smart resume selector based on job requirements."""
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set, Tuple
+import numpy as np
 from rich.console import Console
 
+try:
+    import ahocorasick
+except ImportError:  # Scoring falls back to one substring test per keyword
+    ahocorasick = None
+
 console = Console()
 
+# Words of a job text; keeps the punctuation of names like c++, c# and node.js
+_TOKEN_RE = re.compile(r"[a-z0-9+.#]+")
+
 
 class ResumeSelector:
     """Selects the most appropriate resume based on job details."""
@@ -14,8 +25,76 @@ class ResumeSelector:
         """Initialize the resume selector."""
         self.resumes_dir = Path(resumes_dir)
         self.resume_profiles: Dict[str, Dict] = {}
+        self._profile_names: Tuple[str, ...] = ()
+        self._keyword_index: Dict[str, int] = {}
+        self._weight_matrix = np.zeros((0, 0))  # keyword x profile -> weight if the profile lists it
+        self._token_keywords: frozenset = frozenset()
+        self._phrase_keywords: Tuple[str, ...] = ()
+        self._automaton = None
+        self._default_profile: Optional[Dict] = None
+        # Jobs are often seen again; selections are cached per job text until profiles change
+        self._select_cached = lru_cache(maxsize=1024)(self._select)
         self._load_resume_profiles()
     
+    def _build_scoring_table(self):
+        """Index every profile's keywords once so scoring does no per-call prep."""
+        self._select_cached.cache_clear()
+        # Profiles only change through here; the first one is the fallback choice
+        self._default_profile = next(iter(self.resume_profiles.values()), None)
+        
+        # One row per distinct keyword, one column per profile, so a job's scores
+        # are the sum of its matched rows however many profiles there are
+        self._profile_names = tuple(self.resume_profiles)
+        profile_keywords = [
+            {k.lower() for k in data["keywords"]} - {""}
+            for data in self.resume_profiles.values()
+        ]
+        self._keyword_index = {}
+        for keywords in profile_keywords:
+            for keyword in sorted(keywords):
+                self._keyword_index.setdefault(keyword, len(self._keyword_index))
+        
+        self._weight_matrix = np.zeros((len(self._keyword_index), len(self._profile_names)))
+        for column, (keywords, data) in enumerate(zip(profile_keywords, self.resume_profiles.values())):
+            rows = [self._keyword_index[keyword] for keyword in keywords]
+            self._weight_matrix[rows, column] = data["weight"]
+        
+        # Plain words are looked up among the text's tokens; phrases and keywords
+        # with a leading dot (".net" in "asp.net") are found as substrings
+        self._token_keywords = frozenset(
+            keyword for keyword in self._keyword_index
+            if _TOKEN_RE.fullmatch(keyword) and not keyword.startswith(".")
+        )
+        self._phrase_keywords = tuple(
+            keyword for keyword in self._keyword_index if keyword not in self._token_keywords
+        )
+        
+        self._automaton = None
+        if ahocorasick is None or not self._phrase_keywords:
+            return
+        self._automaton = ahocorasick.Automaton()
+        for keyword in self._phrase_keywords:
+            self._automaton.add_word(keyword, keyword)
+        self._automaton.make_automaton()
+    
+    def _matched_keywords(self, search_text: str) -> Set[str]:
+        """Keywords found in the (lowercased) text."""
+        tokens = {token.rstrip(".") for token in _TOKEN_RE.findall(search_text)}
+        matched = set(self._token_keywords.intersection(tokens))
+        
+        if self._automaton is not None:
+            matched.update(keyword for _, keyword in self._automaton.iter(search_text))
+        else:
+            matched.update(keyword for keyword in self._phrase_keywords if keyword in search_text)
+        return matched
+    
+    def _score(self, search_text: str) -> Tuple[Dict[str, float], Set[str]]:
+        """Score every profile by the keywords found in the text; each keyword counts once."""
+        matched = self._matched_keywords(search_text)
+        rows = [self._keyword_index[keyword] for keyword in matched]
+        totals = self._weight_matrix[rows].sum(axis=0)
+        return dict(zip(self._profile_names, totals.tolist())), matched
+    
     def _load_resume_profiles(self):
         """Load resume profiles from configuration."""
         # Define resume profiles with keywords
@@ -52,6 +131,8 @@ class ResumeSelector:
                 console.print(f"[dim]Loaded resume profile: {profile_name} ({profile_data['file']})[/dim]")
             else:
                 console.print(f"[yellow]Warning: Resume not found: {profile_data['file']}[/yellow]")
+        
+        self._build_scoring_table()
     
     def select_resume(
         self,
@@ -76,49 +157,40 @@ class ResumeSelector:
         
         # If only one resume, return it
         if len(self.resume_profiles) == 1:
-            profile = list(self.resume_profiles.values())[0]
-            return str(self.resumes_dir / profile["file"])
+            return str(self.resumes_dir / self._default_profile["file"])
         
         # Combine all text for matching
         search_text = f"{job_title} {job_description or ''} {company or ''}".lower()
         
-        # Score each resume
-        scores = {}
-        for profile_name, profile_data in self.resume_profiles.items():
-            score = 0
-            matched_keywords = []
-            
-            for keyword in profile_data["keywords"]:
-                if keyword.lower() in search_text:
-                    score += 1
-                    matched_keywords.append(keyword)
-            
-            # Apply weight
-            score *= profile_data["weight"]
-            scores[profile_name] = {
-                "score": score,
-                "matched_keywords": matched_keywords,
-                "file": profile_data["file"]
-            }
+        resume_path, message = self._select_cached(search_text)
+        console.print(message)
+        return resume_path
+    
+    def _select(self, search_text: str) -> Tuple[str, str]:
+        """Best resume path for a lowercased job text, with the line that reports the choice."""
+        # Score each resume: count keyword hits, then apply weight
+        scores, matched = self._score(search_text)
         
         # Find the best match
-        if not any(s["score"] > 0 for s in scores.values()):
+        if not any(score > 0 for score in scores.values()):
             # No keywords matched, use default (first resume)
-            default_profile = list(self.resume_profiles.values())[0]
-            console.print(f"[yellow]No keyword matches, using default: {default_profile['file']}[/yellow]")
-            return str(self.resumes_dir / default_profile["file"])
+            default_profile = self._default_profile
+            return (
+                str(self.resumes_dir / default_profile["file"]),
+                f"[yellow]No keyword matches, using default: {default_profile['file']}[/yellow]"
+            )
         
         # Get the highest scoring resume
-        best_profile = max(scores.items(), key=lambda x: x[1]["score"])
-        profile_name, profile_info = best_profile
+        profile_name, score = max(scores.items(), key=lambda x: x[1])
+        profile_info = self.resume_profiles[profile_name]
+        matched_keywords = [k for k in profile_info["keywords"] if k.lower() in matched]
         
-        console.print(
+        return (
+            str(self.resumes_dir / profile_info["file"]),
             f"[cyan]Selected resume:[/cyan] {profile_info['file']} "
-            f"[dim](score: {profile_info['score']}, "
-            f"keywords: {', '.join(profile_info['matched_keywords'][:5])}...)[/dim]"
+            f"[dim](score: {score}, "
+            f"keywords: {', '.join(matched_keywords[:5])}...)[/dim]"
         )
-        
-        return str(self.resumes_dir / profile_info["file"])
     
     def get_resume_by_name(self, name: str) -> Optional[str]:
         """Get a specific resume by profile name."""
@@ -153,6 +225,7 @@ class ResumeSelector:
                 "keywords": [k.lower() for k in keywords],
                 "weight": weight
             }
+            self._build_scoring_table()
             console.print(f"[green]Added resume profile: {name}[/green]")
         else:
             console.print(f"[red]Resume file not found: {filename}[/red]")
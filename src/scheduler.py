@@ -1,8 +1,7 @@
 """Scheduler for running the LinkedIn bot at specified intervals."""
 import asyncio
-from datetime import datetime, time
+from datetime import datetime, timedelta
 from typing import Optional, Callable
-import schedule
 from rich.console import Console
 
 from .config import get_settings
@@ -33,55 +32,59 @@ class JobBotScheduler:
         current_hour = datetime.now().hour
         return self.start_hour <= current_hour < self.end_hour
     
-    def _run_if_scheduled(self):
-        """Run the job function if within scheduled hours."""
-        if self.is_within_schedule():
-            console.print(f"\n[bold cyan]⏰ Running scheduled job at {datetime.now().strftime('%H:%M')}[/bold cyan]")
-            try:
-                # Run async job in sync context
-                asyncio.run(self.job_func())
-            except Exception as e:
-                console.print(f"[red]Error running scheduled job: {e}[/red]")
-        else:
-            console.print(f"[dim]Outside scheduled hours ({self.start_hour}:00 - {self.end_hour}:00)[/dim]")
+    def next_run_time(self, now: Optional[datetime] = None) -> datetime:
+        """Next top of the hour within the scheduled hours."""
+        now = now or datetime.now()
+        candidate = now.replace(minute=0, second=0, microsecond=0)
+        for _ in range(24):
+            candidate += timedelta(hours=1)
+            if self.start_hour <= candidate.hour < self.end_hour:
+                return candidate
+        raise ValueError(f"No hours between {self.start_hour}:00 and {self.end_hour}:00")
     
-    def schedule_jobs(self):
-        """Set up the schedule."""
-        # Clear any existing jobs
-        schedule.clear()
-        
-        # Schedule at the start of each hour within the range
-        for hour in range(self.start_hour, self.end_hour + 1):
-            schedule.every().day.at(f"{hour:02d}:00").do(self._run_if_scheduled)
-        
-        console.print(f"[green]✓ Scheduled jobs from {self.start_hour}:00 to {self.end_hour}:00[/green]")
-        console.print(f"[dim]Jobs will run every hour within this window[/dim]")
+    async def _run_job(self):
+        """Run the job function, reporting rather than raising its errors."""
+        console.print(f"\n[bold cyan]⏰ Running scheduled job at {datetime.now().strftime('%H:%M')}[/bold cyan]")
+        try:
+            await self.job_func()
+        except Exception as e:
+            console.print(f"[red]Error running scheduled job: {e}[/red]")
     
     def run_now(self):
         """Run the job immediately."""
         console.print("[cyan]Running job immediately...[/cyan]")
         asyncio.run(self.job_func())
     
-    def start(self):
-        """Start the scheduler loop."""
+    async def start_async(self):
+        """Run the job now if within schedule, then sleep until each next run."""
         self.is_running = True
-        self.schedule_jobs()
         
+        console.print(f"[green]✓ Scheduled jobs from {self.start_hour}:00 to {self.end_hour}:00[/green]")
+        console.print(f"[dim]Jobs will run every hour within this window[/dim]")
         console.print("\n[bold green]🚀 Scheduler started![/bold green]")
         console.print("[dim]Press Ctrl+C to stop[/dim]")
         
         # Run immediately if within schedule
         if self.is_within_schedule():
-            self._run_if_scheduled()
+            await self._run_job()
+        else:
+            console.print(f"[dim]Outside scheduled hours ({self.start_hour}:00 - {self.end_hour}:00)[/dim]")
         
+        # One event loop for the whole session; it sleeps straight through to the next run
         while self.is_running:
-            schedule.run_pending()
-            asyncio.get_event_loop().run_until_complete(asyncio.sleep(60))
+            next_run = self.next_run_time()
+            console.print(f"[dim]Next run at {next_run.strftime('%Y-%m-%d %H:%M')}[/dim]")
+            await asyncio.sleep(max(0.0, (next_run - datetime.now()).total_seconds()))
+            if self.is_running:
+                await self._run_job()
+    
+    def start(self):
+        """Start the scheduler loop."""
+        asyncio.run(self.start_async())
     
     def stop(self):
         """Stop the scheduler."""
         self.is_running = False
-        schedule.clear()
         console.print("[yellow]Scheduler stopped.[/yellow]")
 
 
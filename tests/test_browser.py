@@ -0,0 +1,69 @@
+"""Tests for the shared browser pool."""
+import asyncio
+from pathlib import Path
+
+# Add src to path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.linkedin import BrowserPool, LinkedInAuthenticator
+
+
+class FakePage:
+    """Page that records the init scripts it inherited from its context."""
+
+    def __init__(self, init_scripts):
+        self.init_scripts = list(init_scripts)
+
+
+class FakeContext:
+    """Just enough of a BrowserContext for get_context and the pool."""
+
+    def __init__(self):
+        self.init_scripts = []
+        self.pages = []
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def new_page(self):
+        page = FakePage(self.init_scripts)
+        self.pages.append(page)
+        return page
+
+
+class FakeBrowser:
+    """Connected browser that hands out fake contexts."""
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+
+def test_pooled_pages_get_stealth_script(tmp_path, monkeypatch):
+    """Test that pages opened from a pooled context hide automation markers."""
+    monkeypatch.setattr(
+        LinkedInAuthenticator, "STORAGE_STATE_PATH", str(tmp_path / "session.json")
+    )
+
+    async def open_page():
+        pool = BrowserPool()
+        pool.browser = FakeBrowser()
+        pool.auth.browser = pool.browser
+        async with pool.context() as context:
+            return await context.new_page()
+
+    page = asyncio.run(open_page())
+
+    assert LinkedInAuthenticator.STEALTH_JS in page.init_scripts
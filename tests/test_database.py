@@ -1,7 +1,6 @@
 """Tests for the database module."""
 import pytest
-import tempfile
-import os
+from datetime import datetime
 from pathlib import Path
 
 # Add src to path
@@ -13,63 +12,66 @@ from src.database import JobRepository, Job, ApplicationStatus
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    
-    repo = JobRepository(f"sqlite:///{db_path}")
+    """Create a fresh in-memory database for testing."""
+    repo = JobRepository("sqlite:///:memory:")
     yield repo
-    
-    # Cleanup
-    os.unlink(db_path)
+    repo.engine.dispose()
+
+
+@pytest.fixture
+def sample_job(temp_db):
+    """Insert one job shared by the tests that only need a stored job."""
+    return temp_db.add_job({
+        "linkedin_job_id": "12345",
+        "title": "Software Engineer",
+        "company": "Test Company",
+        "location": "Remote",
+        "is_easy_apply": True,
+        "search_keyword": "Python"
+    })
 
 
 class TestJobRepository:
     """Test cases for JobRepository."""
     
-    def test_add_job(self, temp_db):
+    def test_add_job(self, sample_job):
         """Test adding a job to the database."""
-        job_data = {
-            "linkedin_job_id": "12345",
-            "title": "Software Engineer",
-            "company": "Test Company",
-            "location": "Remote",
-            "is_easy_apply": True,
-            "search_keyword": "Python"
-        }
-        
-        job = temp_db.add_job(job_data)
-        
-        assert job is not None
-        assert job.linkedin_job_id == "12345"
-        assert job.title == "Software Engineer"
-        assert job.is_easy_apply == True
+        assert sample_job is not None
+        assert sample_job.linkedin_job_id == "12345"
+        assert sample_job.title == "Software Engineer"
+        assert sample_job.is_easy_apply == True
     
-    def test_job_exists(self, temp_db):
-        """Test checking if a job exists."""
-        job_data = {
-            "linkedin_job_id": "12345",
-            "title": "Software Engineer",
-            "company": "Test Company"
-        }
+    def test_posted_at(self, temp_db):
+        """Test storing the parsed posting time next to the raw text."""
+        posted_at = datetime(2024, 1, 2, 3, 4)
+        job = temp_db.add_job({
+            "linkedin_job_id": "posted",
+            "title": "Engineer",
+            "company": "Acme",
+            "posted_date": "2 days ago",
+            "posted_at": posted_at
+        })
         
-        assert temp_db.job_exists("12345") == False
-        temp_db.add_job(job_data)
+        stored = temp_db.get_job_by_linkedin_id("posted")
+        assert stored.posted_at == posted_at
+        assert job.to_dict()["posted_at"] == posted_at.isoformat()
+    
+    def test_job_exists(self, temp_db, sample_job):
+        """Test checking if a job exists."""
         assert temp_db.job_exists("12345") == True
+        assert temp_db.job_exists("67890") == False
     
-    def test_no_duplicate_jobs(self, temp_db):
+    def test_no_duplicate_jobs(self, temp_db, sample_job):
         """Test that duplicate jobs are not added."""
-        job_data = {
+        duplicate = temp_db.add_job({
             "linkedin_job_id": "12345",
             "title": "Software Engineer",
             "company": "Test Company"
-        }
-        
-        job1 = temp_db.add_job(job_data)
-        job2 = temp_db.add_job(job_data)
+        })
         
-        assert job1 is not None
-        assert job2 is None  # Duplicate should return None
+        assert sample_job is not None
+        assert duplicate is None  # Duplicate should return None
+        assert temp_db.get_job_count() == 1
     
     def test_batch_add_jobs(self, temp_db):
         """Test adding multiple jobs in batch."""
@@ -84,33 +86,27 @@ class TestJobRepository:
         assert len(added) == 3
         assert temp_db.get_job_count() == 3
     
-    def test_create_application(self, temp_db):
-        """Test creating an application."""
-        job_data = {
-            "linkedin_job_id": "12345",
-            "title": "Software Engineer",
-            "company": "Test Company"
-        }
-        job = temp_db.add_job(job_data)
+    def test_existing_ids(self, temp_db):
+        """Test finding which job IDs are already stored."""
+        temp_db.add_job({"linkedin_job_id": "1", "title": "Job", "company": "Acme"})
         
+        assert temp_db.existing_ids(["1", "2"]) == {"1"}
+        assert temp_db.existing_ids([]) == set()
+    
+    def test_create_application(self, temp_db, sample_job):
+        """Test creating an application."""
         application = temp_db.create_application(
-            job_id=job.id,
+            job_id=sample_job.id,
             status=ApplicationStatus.PENDING
         )
         
         assert application is not None
-        assert application.job_id == job.id
+        assert application.job_id == sample_job.id
         assert application.status == ApplicationStatus.PENDING.value
     
-    def test_update_application_status(self, temp_db):
+    def test_update_application_status(self, temp_db, sample_job):
         """Test updating application status."""
-        job_data = {
-            "linkedin_job_id": "12345",
-            "title": "Software Engineer",
-            "company": "Test Company"
-        }
-        job = temp_db.add_job(job_data)
-        application = temp_db.create_application(job.id)
+        application = temp_db.create_application(sample_job.id)
         
         updated = temp_db.update_application_status(
             application.id,
@@ -120,24 +116,104 @@ class TestJobRepository:
         assert updated.status == ApplicationStatus.EASY_APPLY.value
         assert updated.applied_at is not None
     
+    def test_record_applications(self, temp_db):
+        """Test inserting finished applications in one batch."""
+        jobs = temp_db.add_jobs_batch([
+            {"linkedin_job_id": str(i), "title": f"Job {i}", "company": "Acme"}
+            for i in range(2)
+        ])
+        
+        temp_db.record_applications([
+            (jobs[0].id, "resume.pdf", ApplicationStatus.EASY_APPLY, None),
+            (jobs[1].id, "resume.pdf", ApplicationStatus.FAILED, "Form error"),
+        ])
+        
+        applied = temp_db.get_application_for_job(jobs[0].id)
+        failed = temp_db.get_application_for_job(jobs[1].id)
+        assert applied.applied_at is not None
+        assert failed.status == ApplicationStatus.FAILED.value
+        assert failed.error_message == "Form error"
+        assert temp_db.get_application_stats()["easy_apply"] == 1
+    
     def test_get_application_stats(self, temp_db):
         """Test getting application statistics."""
         # Add some jobs and applications
-        for i in range(5):
-            job = temp_db.add_job({
+        jobs = temp_db.add_jobs_batch([
+            {
                 "linkedin_job_id": str(i),
                 "title": f"Job {i}",
                 "company": f"Company {i}",
                 "is_easy_apply": True
-            })
-            if i < 3:
-                temp_db.create_application(job.id, ApplicationStatus.EASY_APPLY)
+            }
+            for i in range(5)
+        ])
+        for job in jobs[:3]:
+            temp_db.create_application(job.id, ApplicationStatus.EASY_APPLY)
         
         stats = temp_db.get_application_stats()
         
         assert stats["total_jobs"] == 5
         assert stats["total_applications"] == 3
         assert stats["easy_apply"] == 3
+    
+    def test_stats_follow_status_updates(self, temp_db):
+        """Test that statistics follow application status changes."""
+        job = temp_db.add_job({
+            "linkedin_job_id": "12345",
+            "title": "Software Engineer",
+            "company": "Test Company"
+        })
+        application = temp_db.create_application(job.id)
+        assert temp_db.get_application_stats()["pending"] == 1
+        
+        temp_db.update_application_status(application.id, ApplicationStatus.FAILED)
+        stats = temp_db.get_application_stats()
+        
+        assert stats["total_applications"] == 1
+        assert stats["pending"] == 0
+        assert stats["failed"] == 1
+    
+    def test_stats_without_counters(self, temp_db):
+        """Test the grouped-count fallback matches the trigger counters."""
+        for job_id in ("1", "2"):
+            job = temp_db.add_job({"linkedin_job_id": job_id, "title": "Engineer", "company": "Acme"})
+            temp_db.create_application(job.id)
+        expected = temp_db.get_application_stats()
+        
+        temp_db.has_stats_counters = False
+        stats = temp_db.get_application_stats()
+        
+        assert stats == expected
+        assert stats["total_jobs"] == 2
+        assert stats["pending"] == 2
+    
+    def test_search_jobs(self, temp_db):
+        """Test searching jobs by keyword."""
+        temp_db.add_jobs_batch([
+            {"linkedin_job_id": "1", "title": "Python Developer", "company": "Acme"},
+            {"linkedin_job_id": "2", "title": "Embedded Engineer", "company": "Pythonic Labs"},
+            {"linkedin_job_id": "3", "title": "Designer", "company": "Studio",
+             "description": "Some Python scripting"},
+        ])
+        
+        found = {job.linkedin_job_id for job in temp_db.search_jobs("python")}
+        
+        assert found == {"1", "2", "3"}
+        assert temp_db.search_jobs("golang") == []
+    
+    def test_cover_letter_cache(self, temp_db):
+        """Test caching and replacing generated cover letters."""
+        assert temp_db.get_cached_cover_letter("job", "resume", 1) is None
+        
+        temp_db.save_cover_letter("job", "resume", 1, "First letter")
+        assert temp_db.get_cached_cover_letter("job", "resume", 1) == "First letter"
+        
+        # A different resume or prompt version is a cache miss
+        assert temp_db.get_cached_cover_letter("job", "other", 1) is None
+        assert temp_db.get_cached_cover_letter("job", "resume", 2) is None
+        
+        temp_db.save_cover_letter("job", "resume", 1, "Second letter")
+        assert temp_db.get_cached_cover_letter("job", "resume", 1) == "Second letter"
 
 
 if __name__ == "__main__":